@@ -10,15 +10,148 @@ This CLI provides commands for:
 """
 
 import click
-import json
+import contextlib
+import functools
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 
 from src.chord_parser import quick_parse, ChordParseError
-from src.fingering_generator import FingeringGenerator
-from src.diagram_generator import generate_chord_diagram, ChordDiagramGenerator
+from src.fingering_generator import FingeringGenerator, GenerationConfig
 from src.fingering import Fingering
+from src.music_theory import Chord
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: diagram generation pulls in matplotlib
+    from src.diagram_generator import ChordDiagramGenerator
+
+try:
+    import orjson
+
+    def _dumps(data) -> str:
+        """Serialize to indented JSON using orjson."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(data) -> str:
+        """Serialize to indented JSON using the standard library."""
+        return json.dumps(data, indent=2)
+
+
+# Display strings for fret numbers in shape strings ("x" for a muted string)
+_FRET_STR = {None: 'x', **{i: str(i) for i in range(25)}}
+
+# String numbers in display order (low E to high E)
+_STRING_RANGE = (6, 5, 4, 3, 2, 1)
+
+# Fewest distinct chords worth starting a process pool for in `batch`; below
+# this, worker start-up costs more than the parallelism saves
+_MIN_PARALLEL_CHORDS = 8
+
+
+def _finger_list(fingering: Fingering) -> List[int]:
+    """Finger numbers indexed by string - 1 (high E first); 0 = open, muted or unused."""
+    fingers = [0] * 6
+    for string, finger in fingering.finger_assignments.items():
+        if finger.value > 0:  # Only include actual finger assignments
+            fingers[string - 1] = finger.value
+    return fingers
+
+
+def _format_fingerings(chord: Chord, fingerings: List[Fingering]) -> Iterator[str]:
+    """Yield the text-format lines for generate's output."""
+    yield f"Chord: {chord}\n"
+    
+    for i, fingering in enumerate(fingerings):
+        shape = fingering.get_chord_shape()
+        shape_str = '-'.join(_FRET_STR[f] for f in shape)
+        
+        # Get finger numbers for display (strings 6 to 1, skipping OPEN/MUTED)
+        fa = fingering.finger_assignments
+        finger_nums = [str(fa[s].value) for s in _STRING_RANGE if s in fa and fa[s].value > 0]
+        
+        yield f"\nFingering #{i+1}:"
+        yield f"  Shape: {shape_str}"
+        yield f"  Fingers: {'-'.join(finger_nums) if finger_nums else 'open position'}"
+        yield f"  Difficulty: {fingering.difficulty:.2f}"
+        
+        # Add characteristics
+        characteristics = fingering.characteristics
+        if characteristics.get('is_barre_chord'):
+            yield "  Type: Barre chord"
+        elif characteristics.get('is_open_position'):
+            yield "  Type: Open position"
+
+
+_GENERATOR: Optional[FingeringGenerator] = None
+
+
+def _get_generator() -> FingeringGenerator:
+    """Return the shared fingering generator, creating it on first use."""
+    global _GENERATOR
+    if _GENERATOR is None:
+        _GENERATOR = FingeringGenerator()
+    return _GENERATOR
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_parse(symbol: str) -> Chord:
+    """Parse a chord symbol, reusing the result for repeated symbols."""
+    return quick_parse(symbol)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_fingerings(symbol: str, k: Optional[int] = None) -> Tuple[Fingering, ...]:
+    """Generate ranked fingerings for a chord symbol, cached per symbol.
+
+    With k set, only the best k fingerings are selected (see generate_top_k).
+    """
+    chord = _cached_parse(symbol)
+    if k is None:
+        return tuple(_get_generator().generate_fingerings(chord))
+    return tuple(_get_generator().generate_top_k(chord, k))
+
+
+def _process_one(chord_name: str) -> Tuple[str, Optional[Fingering], Optional[str]]:
+    """Generate the best fingering for one chord name.
+
+    Top-level so it can be pickled into worker processes; each worker builds
+    its own generator (and cache) rather than sharing one across processes.
+
+    Returns:
+        Tuple of (chord name, best fingering or None, error message or None)
+    """
+    try:
+        fingerings = _cached_fingerings(chord_name, 1)
+        if fingerings:
+            return chord_name, fingerings[0], None
+        return chord_name, None, "No fingerings found"
+    except ChordParseError as e:
+        return chord_name, None, str(e)
+    except Exception as e:
+        return chord_name, None, f"Error: {str(e)}"
+
+
+_DIAGRAM_GEN: Optional['ChordDiagramGenerator'] = None
+
+
+def _render_one(job: Tuple[Fingering, str, int]) -> str:
+    """Render a single diagram file; top-level so it can run in a worker.
+
+    Each process keeps one diagram generator so its figure is reused across
+    every file that process renders.
+    """
+    global _DIAGRAM_GEN
+    if _DIAGRAM_GEN is None:
+        from src.diagram_generator import ChordDiagramGenerator
+        _DIAGRAM_GEN = ChordDiagramGenerator()
+    fingering, output_file, dpi = job
+    _DIAGRAM_GEN.render_to_file(fingering, output_file, dpi=dpi)
+    return output_file
 
 
 @click.group()
@@ -42,84 +175,54 @@ def generate(chord_name: str, num_fingerings: int, format: str, output: Optional
         chord-generator generate "F#m7" -n 5
         chord-generator generate "Cmaj7/E" --format json -o cmaj7.json
     """
+    # Parse the chord
     try:
-        # Parse the chord
         chord = quick_parse(chord_name)
-        
-        # Generate fingerings
-        generator = FingeringGenerator()
-        fingerings = generator.generate_fingerings(chord)[:num_fingerings]
-        
-        if not fingerings:
-            click.echo(f"No fingerings found for {chord_name}", err=True)
-            sys.exit(1)
-        
-        # Format output
-        if format == 'json':
-            output_data = {
-                'chord': str(chord),
-                'fingerings': []
-            }
-            
-            for i, fingering in enumerate(fingerings):
-                shape = fingering.get_chord_shape()
-                finger_assignments = {}
-                for string, finger in fingering.finger_assignments.items():
-                    if finger.value > 0:  # Only include actual finger assignments
-                        finger_assignments[string] = finger.value
-                
-                output_data['fingerings'].append({
-                    'rank': i + 1,
-                    'shape': [None if f is None else f for f in shape],
-                    'shape_string': '-'.join(['x' if f is None else str(f) for f in shape]),
-                    'finger_assignments': finger_assignments,
-                    'difficulty': round(fingering.difficulty, 3),
-                    'characteristics': fingering.characteristics
-                })
-            
-            result = json.dumps(output_data, indent=2)
-        else:
-            # Text format
-            lines = [f"Chord: {chord}\n"]
-            
-            for i, fingering in enumerate(fingerings):
-                shape = fingering.get_chord_shape()
-                shape_str = '-'.join(['x' if f is None else str(f) for f in shape])
-                
-                # Get finger numbers for display
-                finger_nums = []
-                for string in range(6, 0, -1):  # Check strings 6 to 1
-                    if string in fingering.finger_assignments:
-                        finger = fingering.finger_assignments[string]
-                        if finger.value > 0:  # Not OPEN or MUTED
-                            finger_nums.append(str(finger.value))
-                
-                lines.append(f"\nFingering #{i+1}:")
-                lines.append(f"  Shape: {shape_str}")
-                lines.append(f"  Fingers: {'-'.join(finger_nums) if finger_nums else 'open position'}")
-                lines.append(f"  Difficulty: {fingering.difficulty:.2f}")
-                
-                # Add characteristics
-                if fingering.characteristics.get('is_barre_chord'):
-                    lines.append("  Type: Barre chord")
-                elif fingering.characteristics.get('is_open_position'):
-                    lines.append("  Type: Open position")
-            
-            result = '\n'.join(lines)
-        
-        # Output
-        if output:
-            Path(output).write_text(result)
-            click.echo(f"Output written to {output}")
-        else:
-            click.echo(result)
-            
     except ChordParseError as e:
         click.echo(f"Error parsing chord: {e}", err=True)
         sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
+    
+    # Generate fingerings
+    generator = _get_generator()
+    fingerings = generator.generate_fingerings(chord)[:num_fingerings]
+    
+    if not fingerings:
+        click.echo(f"No fingerings found for {chord_name}", err=True)
         sys.exit(1)
+    
+    # Format output
+    if format == 'json':
+        output_data = {
+            'chord': str(chord),
+            'fingerings': []
+        }
+        
+        for i, fingering in enumerate(fingerings):
+            shape = fingering.get_chord_shape()
+            output_data['fingerings'].append({
+                'rank': i + 1,
+                'shape': list(shape),
+                'shape_string': '-'.join(_FRET_STR[f] for f in shape),
+                'finger_assignments': _finger_list(fingering),
+                'difficulty': round(fingering.difficulty, 3),
+                'characteristics': fingering.characteristics
+            })
+        
+        result = _dumps(output_data)
+    else:
+        # Text format
+        result = '\n'.join(_format_fingerings(chord, fingerings))
+    
+    # Output
+    if output:
+        try:
+            Path(output).write_text(result)
+        except OSError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+        click.echo(f"Output written to {output}")
+    else:
+        click.echo(result)
 
 
 @cli.command()
@@ -137,43 +240,44 @@ def diagram(chord_name: str, output: str, fingering_number: int, dpi: int, style
         chord-generator diagram "F#m7" -o f_sharp_minor_7.svg -n 2
         chord-generator diagram "Gmaj7" -o gmaj7.pdf --dpi 300
     """
+    # Parse the chord
     try:
-        # Parse the chord
         chord = quick_parse(chord_name)
-        
-        # Generate fingerings
-        generator = FingeringGenerator()
-        fingerings = generator.generate_fingerings(chord)
-        
-        if not fingerings:
-            click.echo(f"No fingerings found for {chord_name}", err=True)
-            sys.exit(1)
-            
-        if fingering_number > len(fingerings):
-            click.echo(f"Only {len(fingerings)} fingerings available. Using the 1st one.", err=True)
-            fingering_number = 1
-        
-        # Get the selected fingering
-        fingering = fingerings[fingering_number - 1]
-        
-        # Generate diagram
-        output_path = Path(output)
-        generate_chord_diagram(fingering, str(output_path), dpi=dpi)
-        
-        click.echo(f"Chord diagram saved to {output_path}")
-        
-        # Show info about the fingering
-        shape = fingering.get_chord_shape()
-        shape_str = '-'.join(['x' if f is None else str(f) for f in shape])
-        click.echo(f"Shape: {shape_str}")
-        click.echo(f"Difficulty: {fingering.difficulty:.2f}")
-        
     except ChordParseError as e:
         click.echo(f"Error parsing chord: {e}", err=True)
         sys.exit(1)
-    except Exception as e:
+    
+    # Generate only as many fingerings as needed, up to the usual result limit
+    generator = _get_generator()
+    fingerings = generator.generate_top_k(chord, min(fingering_number, GenerationConfig().max_results))
+    
+    if not fingerings:
+        click.echo(f"No fingerings found for {chord_name}", err=True)
+        sys.exit(1)
+        
+    if fingering_number > len(fingerings):
+        click.echo(f"Only {len(fingerings)} fingerings available. Using the 1st one.", err=True)
+        fingering_number = 1
+    
+    # Get the selected fingering
+    fingering = fingerings[fingering_number - 1]
+    
+    # Generate diagram
+    from src.diagram_generator import generate_chord_diagram
+    output_path = Path(output)
+    try:
+        generate_chord_diagram(fingering, str(output_path), dpi=dpi)
+    except OSError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
+    
+    click.echo(f"Chord diagram saved to {output_path}")
+    
+    # Show info about the fingering
+    shape = fingering.get_chord_shape()
+    shape_str = '-'.join(_FRET_STR[f] for f in shape)
+    click.echo(f"Shape: {shape_str}")
+    click.echo(f"Difficulty: {fingering.difficulty:.2f}")
 
 
 @cli.command()
@@ -184,7 +288,10 @@ def diagram(chord_name: str, output: str, fingering_number: int, dpi: int, style
 @click.option('-d', '--dpi', default=150, help='Image resolution in DPI (default: 150)')
 @click.option('--grid/--separate', default=False, help='Generate grid layout vs separate files')
 @click.option('-c', '--columns', default=4, help='Columns in grid layout (default: 4)')
-def batch(input_file: str, output_dir: str, format: str, dpi: int, grid: bool, columns: int):
+@click.option('-j', '--jobs', default=os.cpu_count() or 1, show_default=True,
+              help='Maximum worker processes (1 = run serially; small batches always run serially)')
+def batch(input_file: str, output_dir: str, format: str, dpi: int, grid: bool, columns: int,
+          jobs: int):
     """Process multiple chords from a file.
     
     The input file should contain one chord name per line.
@@ -196,8 +303,8 @@ def batch(input_file: str, output_dir: str, format: str, dpi: int, grid: bool, c
     """
     try:
         # Read chord names from file
-        chord_names = Path(input_file).read_text().strip().split('\n')
-        chord_names = [name.strip() for name in chord_names if name.strip()]
+        with open(input_file) as fh:
+            chord_names = [name for name in (line.strip() for line in fh) if name]
         
         if not chord_names:
             click.echo("No chord names found in input file", err=True)
@@ -206,168 +313,237 @@ def batch(input_file: str, output_dir: str, format: str, dpi: int, grid: bool, c
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        # Generate fingerings for all chords
-        generator = FingeringGenerator()
-        chord_fingerings = []
+        # Generate fingerings once per distinct chord name (order preserved)
+        unique_names = list(dict.fromkeys(chord_names))
+        best_fingerings: Dict[str, Fingering] = {}
         failed_chords = []
+        jobs = min(max(1, jobs), len(unique_names))
+        use_pool = jobs > 1 and len(unique_names) >= _MIN_PARALLEL_CHORDS
+        executor = ProcessPoolExecutor(max_workers=jobs) if use_pool else None
         
-        with click.progressbar(chord_names, label='Generating fingerings') as chords:
-            for chord_name in chords:
-                try:
-                    chord = quick_parse(chord_name)
-                    fingerings = generator.generate_fingerings(chord)
-                    if fingerings:
-                        chord_fingerings.append(fingerings[0])
+        try:
+            if executor:
+                chunksize = max(1, len(unique_names) // (4 * jobs))
+                results = executor.map(_process_one, unique_names, chunksize=chunksize)
+            else:
+                results = map(_process_one, unique_names)
+            
+            # Only draw a progress bar for an interactive terminal, redrawing ~100 times
+            if sys.stderr.isatty():
+                progress = click.progressbar(results, length=len(unique_names),
+                                             label='Generating fingerings', file=sys.stderr,
+                                             update_min_steps=max(1, len(unique_names) // 100))
+            else:
+                progress = contextlib.nullcontext(results)
+            
+            with progress as bar:
+                for chord_name, fingering, error in bar:
+                    if fingering is not None:
+                        best_fingerings[chord_name] = fingering
                     else:
-                        failed_chords.append((chord_name, "No fingerings found"))
-                except ChordParseError as e:
-                    failed_chords.append((chord_name, str(e)))
-                except Exception as e:
-                    failed_chords.append((chord_name, f"Error: {str(e)}"))
-        
-        # Report any failures
-        if failed_chords:
-            click.echo("\nFailed to process some chords:", err=True)
-            for chord_name, error in failed_chords:
-                click.echo(f"  {chord_name}: {error}", err=True)
-        
-        if not chord_fingerings:
-            click.echo("No valid chords to process", err=True)
-            sys.exit(1)
-        
-        # Generate diagrams
-        if grid:
-            # Grid layout
-            output_file = output_path / f"chord_grid.{format}"
-            diagram_gen = ChordDiagramGenerator()
-            diagram_gen.generate_multiple_diagrams(
-                chord_fingerings,
-                str(output_file),
-                cols=columns,
-                dpi=dpi
-            )
-            click.echo(f"\nGenerated grid diagram: {output_file}")
-        else:
-            # Separate files
-            click.echo("\nGenerating individual diagrams...")
-            for fingering in chord_fingerings:
-                chord_name = str(fingering.chord) if fingering.chord else "chord"
-                # Make filename safe
-                safe_name = chord_name.replace('/', '_').replace('#', 'sharp').replace(' ', '_')
-                output_file = output_path / f"{safe_name}.{format}"
-                
-                generate_chord_diagram(fingering, str(output_file), dpi=dpi)
+                        failed_chords.append((chord_name, error))
+            
+            # Re-expand to one entry per input line for the grid layout
+            chord_fingerings = [best_fingerings[name] for name in chord_names if name in best_fingerings]
+            
+            # Report any failures
+            if failed_chords:
+                lines = ["\nFailed to process some chords:"]
+                lines.extend(f"  {chord_name}: {error}" for chord_name, error in failed_chords)
+                click.echo('\n'.join(lines), err=True)
+            
+            if not chord_fingerings:
+                click.echo("No valid chords to process", err=True)
+                sys.exit(1)
+            
+            # Generate diagrams
+            if grid:
+                # Grid layout
+                from src.diagram_generator import ChordDiagramGenerator
+                output_file = output_path / f"chord_grid.{format}"
+                diagram_gen = ChordDiagramGenerator()
+                diagram_gen.generate_multiple_diagrams(
+                    chord_fingerings,
+                    str(output_file),
+                    cols=columns,
+                    dpi=dpi
+                )
+                click.echo(f"\nGenerated grid diagram: {output_file}")
+            else:
+                # Separate files
+                click.echo("\nGenerating individual diagrams...")
+                render_jobs = []
+                for fingering in best_fingerings.values():
+                    chord_name = str(fingering.chord) if fingering.chord else "chord"
+                    # Make filename safe
+                    safe_name = chord_name.replace('/', '_').replace('#', 'sharp').replace(' ', '_')
+                    output_file = output_path / f"{safe_name}.{format}"
+                    render_jobs.append((fingering, str(output_file), dpi))
+            
+                # Renders are independent, so files can be split across the pool
+                for _ in (executor.map(_render_one, render_jobs) if executor
+                          else map(_render_one, render_jobs)):
+                    pass
+            
+                click.echo(f"Generated {len(best_fingerings)} unique diagrams from "
+                           f"{len(chord_names)} entries in {output_path}")
             
-            click.echo(f"Generated {len(chord_fingerings)} diagrams in {output_path}")
+        finally:
+            if executor:
+                executor.shutdown()
         
-    except Exception as e:
+    except OSError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 
+@dataclass
+class _InteractiveState:
+    """Chord currently loaded in interactive mode"""
+    current_chord: Optional[Chord] = None
+    current_fingerings: List[Fingering] = field(default_factory=list)
+
+
+def _handle_quit(command: str, rest: str, state: _InteractiveState) -> bool:
+    return True
+
+
+def _handle_help(command: str, rest: str, state: _InteractiveState) -> None:
+    click.echo("\nCommands:")
+    click.echo("  <chord>     - Generate fingerings for a chord (e.g., C, Am7, F#m7b5)")
+    click.echo("  list        - Show all generated fingerings for current chord")
+    click.echo("  save <n>    - Save fingering #n as a diagram")
+    click.echo("  compare     - Compare all fingerings side by side")
+    click.echo("  help        - Show this help")
+    click.echo("  quit        - Exit interactive mode\n")
+
+
+def _handle_list(command: str, rest: str, state: _InteractiveState) -> None:
+    if not state.current_fingerings:
+        click.echo("No chord loaded. Enter a chord name first.")
+        return
+    click.echo(f"\nFingerings for {state.current_chord}:")
+    for i, fingering in enumerate(state.current_fingerings):
+        shape = fingering.get_chord_shape()
+        shape_str = '-'.join(_FRET_STR[f] for f in shape)
+        click.echo(f"  {i+1}. {shape_str} (difficulty: {fingering.difficulty:.2f})")
+
+
+def _handle_save(command: str, rest: str, state: _InteractiveState) -> None:
+    try:
+        num = int(rest.split()[0])
+    except (ValueError, IndexError):
+        click.echo("Usage: save <fingering_number>")
+        return
+    
+    if not state.current_fingerings:
+        click.echo("No chord loaded. Enter a chord name first.")
+    elif num < 1 or num > len(state.current_fingerings):
+        click.echo(f"Invalid fingering number. Choose 1-{len(state.current_fingerings)}")
+    else:
+        filename = click.prompt('Save as', 
+                              default=f"{str(state.current_chord).replace('/', '_')}.png")
+        from src.diagram_generator import generate_chord_diagram
+        generate_chord_diagram(state.current_fingerings[num-1], filename)
+        click.echo(f"Saved to {filename}")
+
+
+def _handle_compare(command: str, rest: str, state: _InteractiveState) -> None:
+    if not state.current_fingerings:
+        click.echo("No chord loaded. Enter a chord name first.")
+        return
+    filename = click.prompt('Save comparison as', 
+                          default=f"{str(state.current_chord).replace('/', '_')}_compare.png")
+    from src.diagram_generator import ChordDiagramGenerator
+    diagram_gen = ChordDiagramGenerator()
+    diagram_gen.generate_multiple_diagrams(
+        state.current_fingerings[:6],  # Limit to 6 for display
+        filename,
+        cols=3
+    )
+    click.echo(f"Saved comparison to {filename}")
+
+
+def _handle_chord(command: str, rest: str, state: _InteractiveState) -> None:
+    # Anything that isn't a command is treated as a chord name
+    try:
+        chord = _cached_parse(command)
+        fingerings = _cached_fingerings(command)
+        
+        if not fingerings:
+            click.echo(f"No fingerings found for {command}")
+            return
+        
+        state.current_chord = chord
+        state.current_fingerings = list(fingerings[:5])  # Keep top 5
+        
+        click.echo(f"\nGenerated {len(fingerings)} fingerings for {chord}:")
+        for i, fingering in enumerate(state.current_fingerings):
+            shape = fingering.get_chord_shape()
+            shape_str = '-'.join(_FRET_STR[f] for f in shape)
+            
+            # Get finger numbers
+            fa = fingering.finger_assignments
+            finger_nums = [str(fa[s].value) for s in _STRING_RANGE
+                           if s in fa and fa[s].value > 0]
+            
+            click.echo(f"\n  {i+1}. Shape: {shape_str}")
+            click.echo(f"     Fingers: {'-'.join(finger_nums) if finger_nums else 'open'}")
+            click.echo(f"     Difficulty: {fingering.difficulty:.2f}")
+            
+            if fingering.characteristics.get('is_barre_chord'):
+                click.echo("     Type: Barre chord")
+            elif fingering.characteristics.get('is_open_position'):
+                click.echo("     Type: Open position")
+    
+    except ChordParseError as e:
+        click.echo(f"Error parsing chord: {e}")
+
+
+# Interactive commands keyed by the whole (lowercased) input line
+_HANDLERS = {
+    'quit': _handle_quit,
+    'exit': _handle_quit,
+    'q': _handle_quit,
+    'help': _handle_help,
+    'list': _handle_list,
+    'compare': _handle_compare,
+}
+
+# Interactive commands that take arguments, keyed by their (lowercased) first word
+_ARG_HANDLERS = {
+    'save': _handle_save,
+}
+
+
+def _dispatch(command: str) -> Tuple[Callable, str]:
+    """Pick the handler for an interactive input line (chord lookup by default)"""
+    lowered = command.lower()
+    handler = _HANDLERS.get(lowered)
+    if handler is not None:
+        return handler, ''
+    
+    head, sep, rest = lowered.partition(' ')
+    if sep and head in _ARG_HANDLERS:
+        return _ARG_HANDLERS[head], rest
+    return _handle_chord, ''
+
+
 @cli.command()
 def interactive():
     """Interactive chord exploration mode."""
     click.echo("Guitar Chord Generator - Interactive Mode")
     click.echo("Type 'help' for commands, 'quit' to exit\n")
     
-    generator = FingeringGenerator()
-    current_chord = None
-    current_fingerings = []
+    state = _InteractiveState()
     
     while True:
         try:
             command = click.prompt('chord>', type=str).strip()
+            handler, rest = _dispatch(command)
             
-            if command.lower() in ['quit', 'exit', 'q']:
+            if handler(command, rest, state):
                 break
-            
-            elif command.lower() == 'help':
-                click.echo("\nCommands:")
-                click.echo("  <chord>     - Generate fingerings for a chord (e.g., C, Am7, F#m7b5)")
-                click.echo("  list        - Show all generated fingerings for current chord")
-                click.echo("  save <n>    - Save fingering #n as a diagram")
-                click.echo("  compare     - Compare all fingerings side by side")
-                click.echo("  help        - Show this help")
-                click.echo("  quit        - Exit interactive mode\n")
-            
-            elif command.lower() == 'list':
-                if not current_fingerings:
-                    click.echo("No chord loaded. Enter a chord name first.")
-                else:
-                    click.echo(f"\nFingerings for {current_chord}:")
-                    for i, fingering in enumerate(current_fingerings):
-                        shape = fingering.get_chord_shape()
-                        shape_str = '-'.join(['x' if f is None else str(f) for f in shape])
-                        click.echo(f"  {i+1}. {shape_str} (difficulty: {fingering.difficulty:.2f})")
-            
-            elif command.lower().startswith('save '):
-                try:
-                    num = int(command.split()[1])
-                    if not current_fingerings:
-                        click.echo("No chord loaded. Enter a chord name first.")
-                    elif num < 1 or num > len(current_fingerings):
-                        click.echo(f"Invalid fingering number. Choose 1-{len(current_fingerings)}")
-                    else:
-                        filename = click.prompt('Save as', 
-                                              default=f"{str(current_chord).replace('/', '_')}.png")
-                        generate_chord_diagram(current_fingerings[num-1], filename)
-                        click.echo(f"Saved to {filename}")
-                except (ValueError, IndexError):
-                    click.echo("Usage: save <fingering_number>")
-            
-            elif command.lower() == 'compare':
-                if not current_fingerings:
-                    click.echo("No chord loaded. Enter a chord name first.")
-                else:
-                    filename = click.prompt('Save comparison as', 
-                                          default=f"{str(current_chord).replace('/', '_')}_compare.png")
-                    diagram_gen = ChordDiagramGenerator()
-                    diagram_gen.generate_multiple_diagrams(
-                        current_fingerings[:6],  # Limit to 6 for display
-                        filename,
-                        cols=3
-                    )
-                    click.echo(f"Saved comparison to {filename}")
-            
-            else:
-                # Assume it's a chord name
-                try:
-                    chord = quick_parse(command)
-                    fingerings = generator.generate_fingerings(chord)
-                    
-                    if not fingerings:
-                        click.echo(f"No fingerings found for {command}")
-                    else:
-                        current_chord = chord
-                        current_fingerings = fingerings[:5]  # Keep top 5
-                        
-                        click.echo(f"\nGenerated {len(fingerings)} fingerings for {chord}:")
-                        for i, fingering in enumerate(current_fingerings):
-                            shape = fingering.get_chord_shape()
-                            shape_str = '-'.join(['x' if f is None else str(f) for f in shape])
-                            
-                            # Get finger numbers
-                            finger_nums = []
-                            for string in range(6, 0, -1):
-                                if string in fingering.finger_assignments:
-                                    finger = fingering.finger_assignments[string]
-                                    if finger.value > 0:
-                                        finger_nums.append(str(finger.value))
-                            
-                            click.echo(f"\n  {i+1}. Shape: {shape_str}")
-                            click.echo(f"     Fingers: {'-'.join(finger_nums) if finger_nums else 'open'}")
-                            click.echo(f"     Difficulty: {fingering.difficulty:.2f}")
-                            
-                            if fingering.characteristics.get('is_barre_chord'):
-                                click.echo("     Type: Barre chord")
-                            elif fingering.characteristics.get('is_open_position'):
-                                click.echo("     Type: Open position")
-                
-                except ChordParseError as e:
-                    click.echo(f"Error parsing chord: {e}")
-                except Exception as e:
-                    click.echo(f"Error: {e}")
         
         except (EOFError, KeyboardInterrupt):
             click.echo("\nGoodbye!")
@@ -9,10 +9,20 @@ to generate guitar chord fingerings and visual chord diagrams.
 import asyncio
 import json
 import base64
+import hashlib
 import io
-from typing import Any, Dict, List, Optional
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import logging
+import multiprocessing
 
+import jsonschema
+import matplotlib
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.types import (
@@ -30,41 +40,299 @@ from src.fingering_generator import generate_chord_fingerings
 from src.diagram_generator import generate_chord_diagram, ChordDiagramGenerator
 from src.music_theory import Chord
 from src.chord_parser import parse_chord
-from src.fingering import Fingering
+from src import __version__
+from src.fingering import Fingering, FingerAssignment
+from src.fretboard import FretPosition, Fretboard
 
 
-# Configure logging
+try:
+    import orjson
+
+    def _dumps(data: Any) -> str:
+        """Serialize tool results to indented JSON using orjson"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(data: Any) -> str:
+        """Serialize tool results to indented JSON using the standard library"""
+        return json.dumps(data, indent=2)
+
+
+def _json_resource(tool_name: str, json_data: str) -> EmbeddedResource:
+    """Attach a tool's structured results as an application/json resource"""
+    return EmbeddedResource(
+        type="resource",
+        resource=types.TextResourceContents(
+            uri=f"fretboard://results/{tool_name}.json",
+            mimeType="application/json",
+            text=json_data
+        )
+    )
+
+
+# Configure logging (MCP_LOG_LEVEL, default WARNING so routine calls don't log)
+_log_level_name = os.environ.get("MCP_LOG_LEVEL", "WARNING").upper()
+_log_level = logging.getLevelName(_log_level_name)
 logging.basicConfig(
-    level=logging.INFO,
+    level=_log_level if isinstance(_log_level, int) else logging.WARNING,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+if not isinstance(_log_level, int):
+    logger.warning("Unknown MCP_LOG_LEVEL %r, using WARNING", _log_level_name)
 
 # Initialize MCP server
 server = Server("guitar-chord-generator")
 
 
+@lru_cache(maxsize=2048)
+def _cached_fingerings(chord_symbol: str, max_results: int) -> Tuple[Fingering, ...]:
+    """Generate fingerings for a chord symbol, cached across tool calls.
+    
+    Returns a tuple so cached results can't be modified by callers; callers
+    filter or slice it into new lists as needed.
+    """
+    return tuple(generate_chord_fingerings(chord_symbol, max_results=max_results))
+
+
+# Parsed chords are likewise reused for repeated symbols
+_cached_parse = lru_cache(maxsize=512)(parse_chord)
+
+
+@lru_cache(maxsize=2048)
+def _cached_theory(chord_symbol: str) -> Dict[str, Any]:
+    """Music theory data for a chord symbol, cached across tool calls.
+    
+    All values are strings or tuples; the returned dict is shared, so callers
+    copy the keys they need instead of modifying it.
+    """
+    chord = _cached_parse(chord_symbol)
+    return {
+        "root": str(chord.root),
+        "quality": str(chord.quality),
+        "intervals": tuple(str(interval) for interval in chord.get_intervals()),
+        "notes": tuple(str(note) for note in chord.get_notes()),
+        "extensions": tuple(chord.extensions or ()),
+        "alterations": tuple((str(k), str(v)) for k, v in chord.alterations.items()) if chord.alterations else (),
+        "bass_note": str(chord.bass) if chord.bass else None
+    }
+
+
+@lru_cache(maxsize=2048)
+def _cached_theory_summary(chord_symbol: str) -> Tuple[str, ...]:
+    """Readable theory lines for get_chord_info, built once per chord symbol."""
+    theory = _cached_theory(chord_symbol)
+    lines = [
+        "📚 Music Theory:",
+        "  Root: " + theory["root"],
+        "  Quality: " + theory["quality"],
+        "  Notes: " + ", ".join(theory["notes"]),
+        "  Intervals: " + ", ".join(theory["intervals"])
+    ]
+    
+    if theory["extensions"]:
+        lines.append("  Extensions: " + ", ".join(map(str, theory["extensions"])))
+    
+    if theory["alterations"]:
+        lines.append("  Alterations: " + ", ".join(interval + alt for interval, alt in theory["alterations"]))
+    
+    if theory["bass_note"]:
+        lines.append("  Bass Note: " + theory["bass_note"])
+    
+    lines.append("")
+    return tuple(lines)
+
+
+# Shared, read-only fretboard used to resolve diagram position notes
+_FRETBOARD = Fretboard()
+
+# Diagram generator for _render_grid. Rendering runs in _render_pool worker
+# processes, each of which gets its own copy of this instance.
+_DIAGRAM_GEN = ChordDiagramGenerator()
+
+# Every note on the fretboard, indexed as _NOTE_GRID[string - 1][fret].
+_NOTE_GRID = tuple(
+    tuple(_FRETBOARD.get_note_at_position(string, fret)
+          for fret in range(_FRETBOARD.num_frets + 1))
+    for string in range(1, 7)
+)
+
+
+def _note_at(string: int, fret: int):
+    """Look up the note at a string/fret position from the precomputed grid."""
+    if not 1 <= string <= 6:
+        raise ValueError(f"String number must be 1-6, got {string}")
+    if not 0 <= fret <= _FRETBOARD.num_frets:
+        raise ValueError(f"Fret number must be 0-{_FRETBOARD.num_frets}, got {fret}")
+    return _NOTE_GRID[string - 1][fret]
+
+
+# Worker threads for per-chord analysis so CPU-bound work doesn't block the event loop
+_cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Worker processes for matplotlib rendering, which would otherwise hold the
+# GIL and block the event loop. Created on first render by _get_render_pool.
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Return the render process pool, starting it on first use"""
+    global _render_pool
+    if _render_pool is None:
+        # Don't fork from a process running an event loop and worker threads
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _render_pool = ProcessPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(start_method)
+        )
+    return _render_pool
+
+
+def _shutdown_render_pool() -> None:
+    """Stop the render worker processes if they were started"""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(cancel_futures=True)
+        _render_pool = None
+
+
+class ChordLabel:
+    """Picklable stand-in for a Chord that only carries a display name."""
+    
+    __slots__ = ("name",)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __str__(self):
+        return self.name
+
+
+def _render_grid(fingerings: List[Fingering], cols: int, format: str, dpi: int) -> Optional[bytes]:
+    """Render a diagram grid; runs in a _render_pool worker process."""
+    return _DIAGRAM_GEN.generate_multiple_diagrams(
+        fingerings=fingerings,
+        cols=cols,
+        format=format,
+        dpi=dpi
+    )
+
+
+# Renders currently in progress, keyed by diagram cache key. Concurrent
+# requests for the same diagram await the first request's render instead
+# of starting their own.
+_inflight: Dict[str, "asyncio.Future[Optional[bytes]]"] = {}
+
+
+async def _render_shared(cache_key: str, fingerings: List[Fingering], cols: int,
+                         format: str, dpi: int) -> Optional[bytes]:
+    """Render a diagram grid, sharing one render between identical concurrent requests"""
+    future = _inflight.get(cache_key)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_get_render_pool(), _render_grid, fingerings, cols, format, dpi)
+        _inflight[cache_key] = future
+        future.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+    
+    # Shield so one cancelled caller doesn't cancel the render for the others
+    return await asyncio.shield(future)
+
+
+# Maximum number of rendered diagrams kept in the on-disk cache
+_DIAGRAM_CACHE_MAX_FILES = 500
+
+# Bump when diagram rendering changes so stale cached images are not reused
+_DIAGRAM_CACHE_VERSION = 1
+
+
+def _diagram_cache_dir() -> Optional[Path]:
+    """Directory for cached diagram images (FRETBOARD_CACHE_DIR; empty disables)"""
+    cache_dir = os.environ.get("FRETBOARD_CACHE_DIR")
+    if cache_dir is None:
+        return Path.home() / ".cache" / "fretboard"
+    return Path(cache_dir) if cache_dir else None
+
+
+def _diagram_cache_key(fingerings: List[Fingering], columns: int, format_type: str,
+                       dpi: int, include_names: bool) -> str:
+    """Content hash of everything that affects a rendered diagram grid"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((_DIAGRAM_CACHE_VERSION, __version__, matplotlib.__version__)).encode())
+    for fingering in fingerings:
+        positions = sorted((pos.string, pos.fret) for pos in fingering.positions)
+        fingers = sorted((string, finger.value) for string, finger in fingering.finger_assignments.items())
+        name = str(fingering.chord) if fingering.chord else ""
+        digest.update(repr((positions, fingers, name)).encode())
+    digest.update(repr((columns, format_type, dpi, include_names)).encode())
+    return digest.hexdigest()
+
+
+def _read_cached_diagram(key: str, format_type: str) -> Optional[bytes]:
+    """Return cached image bytes for a key, or None on a miss"""
+    cache_dir = _diagram_cache_dir()
+    if cache_dir is None:
+        return None
+    
+    path = cache_dir / f"{key}.{format_type}"
+    try:
+        image_bytes = path.read_bytes()
+        os.utime(path)  # Mark as recently used for eviction
+        return image_bytes
+    except OSError:
+        return None
+
+
+def _write_cached_diagram(key: str, format_type: str, image_bytes: bytes) -> None:
+    """Store image bytes in the cache (best effort) and evict the oldest entries"""
+    cache_dir = _diagram_cache_dir()
+    if cache_dir is None:
+        return
+    
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial image
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as tmp:
+            tmp.write(image_bytes)
+        os.replace(tmp.name, cache_dir / f"{key}.{format_type}")
+        
+        entries = [path for path in cache_dir.iterdir() if path.suffix != ".tmp"]
+        if len(entries) > _DIAGRAM_CACHE_MAX_FILES:
+            entries.sort(key=lambda path: path.stat().st_mtime)
+            for path in entries[:len(entries) - _DIAGRAM_CACHE_MAX_FILES]:
+                path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Could not write diagram cache entry %s: %s", key, e)
+
+
 def format_fingering_for_output(fingering: Fingering) -> Dict[str, Any]:
     """Format a Fingering object for JSON output"""
     try:
+        # Single pass over the positions for both the output list and the muting flag
+        positions = []
+        requires_muting = False
+        for pos in fingering.positions:
+            positions.append({"string": pos.string, "fret": pos.fret})
+            if pos.fret == -1:
+                requires_muting = True
+        
+        characteristics = fingering.characteristics
         return {
-            "positions": [{"string": pos.string, "fret": pos.fret} for pos in fingering.positions],
+            "positions": positions,
             "fingering_pattern": str(fingering),
             "difficulty": round(fingering.difficulty, 3),
             "characteristics": {
-                "is_barre_chord": fingering.characteristics.get("is_barre_chord", False),
-                "span": fingering.characteristics.get("span", 0),
-                "hand_position": fingering.characteristics.get("hand_position", "unknown"),
-                "requires_muting": len([pos for pos in fingering.positions if pos.fret == -1]) > 0
+                "is_barre_chord": characteristics.get("is_barre_chord", False),
+                "span": characteristics.get("span", 0),
+                "hand_position": characteristics.get("hand_position", "unknown"),
+                "requires_muting": requires_muting
             },
             "finger_assignments": {
-                str(string): finger.name if hasattr(finger, 'name') else str(finger)
+                string: finger.name if hasattr(finger, 'name') else str(finger)
                 for string, finger in (fingering.finger_assignments or {}).items()
             },
             "chord_name": str(fingering.chord) if fingering.chord else "Unknown"
         }
     except Exception as e:
-        logger.error(f"Error formatting fingering: {e}")
+        logger.error("Error formatting fingering: %s", e)
         return {
             "error": f"Failed to format fingering: {str(e)}",
             "positions": [],
@@ -73,381 +341,436 @@ def format_fingering_for_output(fingering: Fingering) -> Dict[str, Any]:
         }
 
 
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """List available MCP tools"""
-    return [
-        Tool(
-            name="generate_chord_fingerings",
-            description="Generate multiple guitar fingerings for a chord symbol",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "chord_symbol": {
-                        "type": "string",
-                        "description": "Chord symbol (e.g., 'Cmaj7', 'F#m7b5', 'Dm7/G')"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of fingerings to return",
-                        "default": 5,
-                        "minimum": 1,
-                        "maximum": 10
-                    },
-                    "difficulty_filter": {
-                        "type": "number",
-                        "description": "Maximum difficulty level (0.0-1.0, optional)",
-                        "minimum": 0.0,
-                        "maximum": 1.0
-                    }
-                },
-                "required": ["chord_symbol"]
+# Input schemas for each tool, defined once at import time
+_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "generate_chord_fingerings": {
+        "type": "object",
+        "properties": {
+            "chord_symbol": {
+                "type": "string",
+                "description": "Chord symbol (e.g., 'Cmaj7', 'F#m7b5', 'Dm7/G')"
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of fingerings to return",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 10
+            },
+            "difficulty_filter": {
+                "type": "number",
+                "description": "Maximum difficulty level (0.0-1.0, optional)",
+                "minimum": 0.0,
+                "maximum": 1.0
             }
-        ),
-        Tool(
-            name="analyze_chord_progression",
-            description="Analyze a chord progression with fingering suggestions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "chord_list": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of chord symbols"
-                    },
-                    "analysis_type": {
-                        "type": "string",
-                        "enum": ["fingerings", "theory", "both"],
-                        "default": "both",
-                        "description": "Type of analysis to perform"
-                    },
-                    "max_per_chord": {
-                        "type": "integer",
-                        "default": 2,
-                        "minimum": 1,
-                        "maximum": 5,
-                        "description": "Maximum fingerings per chord"
-                    }
-                },
-                "required": ["chord_list"]
+        },
+        "required": ["chord_symbol"]
+    },
+    "analyze_chord_progression": {
+        "type": "object",
+        "properties": {
+            "chord_list": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of chord symbols"
+            },
+            "analysis_type": {
+                "type": "string",
+                "enum": ["fingerings", "theory", "both"],
+                "default": "both",
+                "description": "Type of analysis to perform"
+            },
+            "max_per_chord": {
+                "type": "integer",
+                "default": 2,
+                "minimum": 1,
+                "maximum": 5,
+                "description": "Maximum fingerings per chord"
             }
-        ),
-        Tool(
-            name="get_chord_info",
-            description="Get detailed music theory information about a chord",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "chord_symbol": {
-                        "type": "string",
-                        "description": "Chord symbol to analyze"
-                    },
-                    "include_theory": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Include music theory analysis"
-                    },
-                    "include_alternatives": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Include alternative fingerings"
-                    }
-                },
-                "required": ["chord_symbol"]
+        },
+        "required": ["chord_list"]
+    },
+    "get_chord_info": {
+        "type": "object",
+        "properties": {
+            "chord_symbol": {
+                "type": "string",
+                "description": "Chord symbol to analyze"
+            },
+            "include_theory": {
+                "type": "boolean",
+                "default": True,
+                "description": "Include music theory analysis"
+            },
+            "include_alternatives": {
+                "type": "boolean",
+                "default": True,
+                "description": "Include alternative fingerings"
             }
-        ),
-        Tool(
-            name="create_chord_diagram",
-            description="Generate chord diagram(s) as a single image. Accepts 1-20 chord fingering specifications and arranges them in a grid layout",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "fingering_specs": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "positions": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "string": {"type": "integer", "minimum": 1, "maximum": 6},
-                                            "fret": {"type": "integer", "minimum": 0, "maximum": 24},
-                                            "finger": {
-                                                "type": "integer", 
-                                                "minimum": -1, 
-                                                "maximum": 4,
-                                                "description": "Finger assignment: -1=muted, 0=open, 1=index, 2=middle, 3=ring, 4=pinky"
-                                            }
-                                        },
-                                        "required": ["string", "fret"]
+        },
+        "required": ["chord_symbol"]
+    },
+    "create_chord_diagram": {
+        "type": "object",
+        "properties": {
+            "fingering_specs": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "positions": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "string": {"type": "integer", "minimum": 1, "maximum": 6},
+                                    "fret": {"type": "integer", "minimum": 0, "maximum": _FRETBOARD.num_frets},
+                                    "finger": {
+                                        "type": "integer", 
+                                        "minimum": -1, 
+                                        "maximum": 4,
+                                        "description": "Finger assignment: -1=muted, 0=open, 1=index, 2=middle, 3=ring, 4=pinky"
                                     }
                                 },
-                                "chord_name": {
-                                    "type": "string",
-                                    "description": "Name to display for this chord diagram"
-                                }
-                            },
-                            "required": ["positions"]
+                                "required": ["string", "fret"]
+                            }
                         },
-                        "description": "List of specific fingering specifications",
-                        "minItems": 1,
-                        "maxItems": 20
+                        "chord_name": {
+                            "type": "string",
+                            "description": "Name to display for this chord diagram"
+                        }
                     },
-                    "columns": {
-                        "type": "integer",
-                        "description": "Number of columns in the grid layout",
-                        "default": 4,
-                        "minimum": 1,
-                        "maximum": 8
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Output image format",
-                        "enum": ["png"],
-                        "default": "png"
-                    },
-                    "dpi": {
-                        "type": "integer",
-                        "description": "Image resolution in DPI",
-                        "default": 150,
-                        "minimum": 72,
-                        "maximum": 600
-                    },
-                    "include_names": {
-                        "type": "boolean",
-                        "description": "Include chord names in diagrams",
-                        "default": True
-                    },
-                    "file_path": {
-                        "type": "string",
-                        "description": "Optional file path to save the batch diagram to. If provided, saves to file instead of returning base64 data"
-                    }
+                    "required": ["positions"]
                 },
-                "required": ["fingering_specs"]
+                "description": "List of specific fingering specifications",
+                "minItems": 1,
+                "maxItems": 20
+            },
+            "columns": {
+                "type": "integer",
+                "description": "Number of columns in the grid layout",
+                "default": 4,
+                "minimum": 1,
+                "maximum": 8
+            },
+            "format": {
+                "type": "string",
+                "description": "Output image format",
+                "enum": ["png"],
+                "default": "png"
+            },
+            "dpi": {
+                "type": "integer",
+                "description": "Image resolution in DPI",
+                "default": 150,
+                "minimum": 72,
+                "maximum": 600
+            },
+            "include_names": {
+                "type": "boolean",
+                "description": "Include chord names in diagrams",
+                "default": True
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Optional file path to save the batch diagram to. If provided, saves to file instead of returning base64 data"
             }
-        )
-    ]
+        },
+        "required": ["fingering_specs"]
+    }
+}
+
+# Validators compiled once from the schemas above; tool calls are checked
+# against these instead of re-validating the schema itself on every call
+_VALIDATORS = {
+    name: jsonschema.validators.validator_for(schema)(schema)
+    for name, schema in _SCHEMAS.items()
+}
+
+
+# Typed tool arguments, built once per call after schema validation. Defaults
+# mirror the schema defaults above; keys the schema doesn't declare are ignored.
+class _ToolArgs:
+    __slots__ = ()
+    
+    @classmethod
+    def from_arguments(cls, arguments: Dict[str, Any]):
+        names = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in arguments.items() if k in names})
 
 
-@server.call_tool()
+@dataclass(slots=True, frozen=True)
+class GenerateFingeringsArgs(_ToolArgs):
+    chord_symbol: str
+    max_results: int = 5
+    difficulty_filter: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
+class AnalyzeProgressionArgs(_ToolArgs):
+    chord_list: List[str]
+    analysis_type: str = "both"
+    max_per_chord: int = 2
+
+
+@dataclass(slots=True, frozen=True)
+class ChordInfoArgs(_ToolArgs):
+    chord_symbol: str
+    include_theory: bool = True
+    include_alternatives: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class CreateDiagramArgs(_ToolArgs):
+    fingering_specs: List[Dict[str, Any]]
+    columns: int = 4
+    format: str = "png"
+    dpi: int = 150
+    include_names: bool = True
+    file_path: Optional[str] = None
+
+
+# Tool definitions, built once and returned as-is for every list_tools request
+_TOOLS: List[Tool] = [
+    Tool(
+        name="generate_chord_fingerings",
+        description="Generate multiple guitar fingerings for a chord symbol",
+        inputSchema=_SCHEMAS["generate_chord_fingerings"]
+    ),
+    Tool(
+        name="analyze_chord_progression",
+        description="Analyze a chord progression with fingering suggestions",
+        inputSchema=_SCHEMAS["analyze_chord_progression"]
+    ),
+    Tool(
+        name="get_chord_info",
+        description="Get detailed music theory information about a chord",
+        inputSchema=_SCHEMAS["get_chord_info"]
+    ),
+    Tool(
+        name="create_chord_diagram",
+        description="Generate chord diagram(s) as a single image. Accepts 1-20 chord fingering specifications and arranges them in a grid layout",
+        inputSchema=_SCHEMAS["create_chord_diagram"]
+    )
+]
+
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """List available MCP tools"""
+    return _TOOLS
+
+
+# The SDK's own input validation is disabled; _VALIDATORS is the single place
+# tool arguments are checked against _SCHEMAS
+@server.call_tool(validate_input=False)
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle MCP tool calls"""
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+        if error is not None:
+            return [TextContent(type="text", text=f"Input validation error: {error.message}")]
+    
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    
     try:
-        if name == "generate_chord_fingerings":
-            return await handle_generate_fingerings(arguments)
-        elif name == "analyze_chord_progression":
-            return await handle_analyze_progression(arguments)
-        elif name == "get_chord_info":
-            return await handle_get_chord_info(arguments)
-        elif name == "create_chord_diagram":
-            return await handle_create_diagram(arguments)
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(arguments)
     except Exception as e:
-        logger.error(f"Error handling tool call {name}: {e}")
+        logger.error("Error handling tool call %s: %s", name, e)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_generate_fingerings(arguments: Dict[str, Any]) -> List[types.TextContent]:
+async def handle_generate_fingerings(arguments: Dict[str, Any]) -> List[types.TextContent | types.EmbeddedResource]:
     """Handle generate_chord_fingerings tool"""
-    chord_symbol = arguments["chord_symbol"]
-    max_results = arguments.get("max_results", 5)
-    difficulty_filter = arguments.get("difficulty_filter")
+    args = GenerateFingeringsArgs.from_arguments(arguments)
     
     try:
         # Generate fingerings
-        fingerings = generate_chord_fingerings(
-            chord_symbol, 
-            max_results=max_results
-        )
+        fingerings = _cached_fingerings(args.chord_symbol, args.max_results)
         
         # Filter by difficulty if specified
-        if difficulty_filter is not None:
-            fingerings = [f for f in fingerings if f.difficulty <= difficulty_filter]
+        if args.difficulty_filter is not None:
+            fingerings = [f for f in fingerings if f.difficulty <= args.difficulty_filter]
         
         if not fingerings:
             return [TextContent(
                 type="text",
-                text=f"No fingerings found for chord '{chord_symbol}'" + 
-                     (f" with difficulty ≤ {difficulty_filter}" if difficulty_filter else "")
+                text=f"No fingerings found for chord '{args.chord_symbol}'" + 
+                     (f" with difficulty ≤ {args.difficulty_filter}" if args.difficulty_filter else "")
             )]
         
         # Format results
         results = {
-            "chord_symbol": chord_symbol,
+            "chord_symbol": args.chord_symbol,
             "total_fingerings": len(fingerings),
             "fingerings": [format_fingering_for_output(f) for f in fingerings]
         }
         
         # Create readable summary
         summary_lines = [
-            f"Generated {len(fingerings)} fingering(s) for {chord_symbol}:",
+            f"Generated {len(fingerings)} fingering(s) for {args.chord_symbol}:",
             ""
         ]
         
         for i, fingering in enumerate(fingerings, 1):
-            summary_lines.append(f"{i}. {str(fingering)}")
+            summary_lines.append(f"{i}. {fingering}")
             if fingering.characteristics.get("is_barre_chord"):
                 summary_lines.append("   Type: Barre chord")
             summary_lines.append("")
         
         summary_text = "\n".join(summary_lines)
-        json_data = json.dumps(results, indent=2)
+        json_data = _dumps(results)
         
         return [
             TextContent(type="text", text=summary_text),
-            TextContent(type="text", text=f"\nDetailed JSON data:\n```json\n{json_data}\n```")
+            _json_resource("generate_chord_fingerings", json_data)
         ]
         
     except Exception as e:
-        logger.error(f"Error generating fingerings for {chord_symbol}: {e}")
+        logger.error("Error generating fingerings for %s: %s", args.chord_symbol, e)
         return [TextContent(type="text", text=f"Error generating fingerings: {str(e)}")]
 
 
 
 
-async def handle_analyze_progression(arguments: Dict[str, Any]) -> List[types.TextContent]:
+def _analyze_one(chord_symbol: str, analysis_type: str, max_per_chord: int) -> Tuple[Dict[str, Any], List[str]]:
+    """Analyze a single chord of a progression.
+    
+    Runs in a worker thread; returns the chord's JSON entry and its summary lines.
+    """
+    summary_lines = []
+    chord_analysis = {"chord_symbol": chord_symbol}
+    
+    # Add fingering analysis if requested
+    if analysis_type in ["fingerings", "both"]:
+        try:
+            fingerings = _cached_fingerings(chord_symbol, max_per_chord)
+            chord_analysis["fingerings"] = [format_fingering_for_output(f) for f in fingerings]
+            
+            summary_lines.append(f"🎵 {chord_symbol}:")
+            for i, f in enumerate(fingerings, 1):
+                summary_lines.append(f"  {i}. {f}")
+            
+        except Exception as e:
+            chord_analysis["fingering_error"] = str(e)
+            summary_lines.append(f"🎵 {chord_symbol}: Error generating fingerings")
+    
+    # Add theory analysis if requested
+    if analysis_type in ["theory", "both"]:
+        try:
+            theory = _cached_theory(chord_symbol)
+            
+            chord_analysis["theory"] = {
+                "root": theory["root"],
+                "quality": theory["quality"],
+                "intervals": list(theory["intervals"]),
+                "notes": list(theory["notes"]),
+                "extensions": list(theory["extensions"]),
+                "bass_note": theory["bass_note"]
+            }
+            
+            if analysis_type == "both":
+                summary_lines.append("  Theory: " + theory["quality"] + " chord with notes " + ", ".join(theory["notes"]))
+            
+        except Exception as e:
+            chord_analysis["theory_error"] = str(e)
+            if analysis_type == "theory":
+                summary_lines.append(f"🎵 {chord_symbol}: Error analyzing theory")
+    
+    summary_lines.append("")
+    return chord_analysis, summary_lines
+
+
+async def handle_analyze_progression(arguments: Dict[str, Any]) -> List[types.TextContent | types.EmbeddedResource]:
     """Handle analyze_chord_progression tool"""
-    chord_list = arguments["chord_list"]
-    analysis_type = arguments.get("analysis_type", "both")
-    max_per_chord = arguments.get("max_per_chord", 2)
+    args = AnalyzeProgressionArgs.from_arguments(arguments)
     
     try:
         results = {
-            "progression": chord_list,
-            "analysis_type": analysis_type,
+            "progression": args.chord_list,
+            "analysis_type": args.analysis_type,
             "chords": []
         }
         
         summary_lines = [
-            f"Chord Progression Analysis: {' - '.join(chord_list)}",
-            f"Analysis Type: {analysis_type}",
+            f"Chord Progression Analysis: {' - '.join(args.chord_list)}",
+            f"Analysis Type: {args.analysis_type}",
             ""
         ]
         
-        for chord_symbol in chord_list:
-            chord_analysis = {"chord_symbol": chord_symbol}
-            
-            # Add fingering analysis if requested
-            if analysis_type in ["fingerings", "both"]:
-                try:
-                    fingerings = generate_chord_fingerings(chord_symbol, max_results=max_per_chord)
-                    chord_analysis["fingerings"] = [format_fingering_for_output(f) for f in fingerings]
-                    
-                    summary_lines.append(f"🎵 {chord_symbol}:")
-                    for i, f in enumerate(fingerings, 1):
-                        summary_lines.append(f"  {i}. {str(f)}")
-                    
-                except Exception as e:
-                    chord_analysis["fingering_error"] = str(e)
-                    summary_lines.append(f"🎵 {chord_symbol}: Error generating fingerings")
-            
-            # Add theory analysis if requested
-            if analysis_type in ["theory", "both"]:
-                try:
-                    chord = parse_chord(chord_symbol)
-                    intervals = chord.get_intervals()
-                    notes = chord.get_notes()
-                    
-                    chord_analysis["theory"] = {
-                        "root": str(chord.root),
-                        "quality": str(chord.quality),
-                        "intervals": [str(interval) for interval in intervals],
-                        "notes": [str(note) for note in notes],
-                        "extensions": list(chord.extensions) if chord.extensions else [],
-                        "bass_note": str(chord.bass) if chord.bass else None
-                    }
-                    
-                    if analysis_type == "both":
-                        summary_lines.append(f"  Theory: {chord.quality} chord with notes {', '.join(str(n) for n in notes)}")
-                    
-                except Exception as e:
-                    chord_analysis["theory_error"] = str(e)
-                    if analysis_type == "theory":
-                        summary_lines.append(f"🎵 {chord_symbol}: Error analyzing theory")
-            
-            summary_lines.append("")
+        # Analyze each distinct chord once, concurrently off the event loop;
+        # repeated symbols (e.g. the tonic in I-IV-V-I) reuse the same result
+        unique_symbols = list(dict.fromkeys(args.chord_list))
+        loop = asyncio.get_running_loop()
+        per_chord = await asyncio.gather(*[
+            loop.run_in_executor(_cpu_pool, _analyze_one, chord_symbol, args.analysis_type, args.max_per_chord)
+            for chord_symbol in unique_symbols
+        ])
+        analyzed = dict(zip(unique_symbols, per_chord))
+        
+        # Report in progression order
+        for chord_symbol in args.chord_list:
+            chord_analysis, chord_lines = analyzed[chord_symbol]
+            summary_lines.extend(chord_lines)
             results["chords"].append(chord_analysis)
         
         # Add progression-level insights
-        if len(chord_list) > 1:
+        if len(args.chord_list) > 1:
             summary_lines.append("💡 Progression Insights:")
-            summary_lines.append(f"  - {len(chord_list)} chords total")
+            summary_lines.append(f"  - {len(args.chord_list)} chords total")
             
             # Count chord types
-            if analysis_type in ["theory", "both"]:
+            if args.analysis_type in ["theory", "both"]:
                 qualities = []
                 for chord_data in results["chords"]:
                     if "theory" in chord_data:
                         qualities.append(chord_data["theory"]["quality"])
                 
                 if qualities:
-                    unique_qualities = set(qualities)
-                    summary_lines.append(f"  - Chord qualities: {', '.join(unique_qualities)}")
+                    # dict.fromkeys keeps first-seen order so the summary is deterministic
+                    summary_lines.append(f"  - Chord qualities: {', '.join(dict.fromkeys(qualities))}")
         
         summary_text = "\n".join(summary_lines)
-        json_data = json.dumps(results, indent=2)
+        json_data = _dumps(results)
         
         return [
             TextContent(type="text", text=summary_text),
-            TextContent(type="text", text=f"\nDetailed JSON data:\n```json\n{json_data}\n```")
+            _json_resource("analyze_chord_progression", json_data)
         ]
         
     except Exception as e:
-        logger.error(f"Error analyzing progression: {e}")
+        logger.error("Error analyzing progression: %s", e)
         return [TextContent(type="text", text=f"Error analyzing progression: {str(e)}")]
 
 
-async def handle_get_chord_info(arguments: Dict[str, Any]) -> List[types.TextContent]:
+async def handle_get_chord_info(arguments: Dict[str, Any]) -> List[types.TextContent | types.EmbeddedResource]:
     """Handle get_chord_info tool"""
-    chord_symbol = arguments["chord_symbol"]
-    include_theory = arguments.get("include_theory", True)
-    include_alternatives = arguments.get("include_alternatives", True)
+    args = ChordInfoArgs.from_arguments(arguments)
     
     try:
-        results = {"chord_symbol": chord_symbol}
-        summary_lines = [f"🎸 Chord Information: {chord_symbol}", ""]
+        results = {"chord_symbol": args.chord_symbol}
+        summary_lines = [f"🎸 Chord Information: {args.chord_symbol}", ""]
         
         # Parse chord and get theory information
-        if include_theory:
+        if args.include_theory:
             try:
-                chord = parse_chord(chord_symbol)
-                intervals = chord.get_intervals()
-                notes = chord.get_notes()
+                theory = _cached_theory(args.chord_symbol)
                 
                 theory_info = {
-                    "root": str(chord.root),
-                    "quality": str(chord.quality),
-                    "intervals": [str(interval) for interval in intervals],
-                    "notes": [str(note) for note in notes],
-                    "extensions": list(chord.extensions) if chord.extensions else [],
-                    "alterations": {str(k): str(v) for k, v in chord.alterations.items()} if chord.alterations else {},
-                    "bass_note": str(chord.bass) if chord.bass else None
+                    "root": theory["root"],
+                    "quality": theory["quality"],
+                    "intervals": list(theory["intervals"]),
+                    "notes": list(theory["notes"]),
+                    "extensions": list(theory["extensions"]),
+                    "alterations": dict(theory["alterations"]),
+                    "bass_note": theory["bass_note"]
                 }
                 
                 results["theory"] = theory_info
-                
-                summary_lines.extend([
-                    "📚 Music Theory:",
-                    f"  Root: {chord.root}",
-                    f"  Quality: {chord.quality}",
-                    f"  Notes: {', '.join(str(n) for n in notes)}",
-                    f"  Intervals: {', '.join(str(i) for i in intervals)}"
-                ])
-                
-                if chord.extensions:
-                    summary_lines.append(f"  Extensions: {', '.join(map(str, chord.extensions))}")
-                
-                if chord.alterations:
-                    alt_str = ', '.join(f"{interval}{alt}" for interval, alt in chord.alterations.items())
-                    summary_lines.append(f"  Alterations: {alt_str}")
-                
-                if chord.bass:
-                    summary_lines.append(f"  Bass Note: {chord.bass}")
-                
-                summary_lines.append("")
+                summary_lines.extend(_cached_theory_summary(args.chord_symbol))
                 
             except Exception as e:
                 results["theory_error"] = str(e)
@@ -455,14 +778,14 @@ async def handle_get_chord_info(arguments: Dict[str, Any]) -> List[types.TextCon
                 summary_lines.append("")
         
         # Get alternative fingerings
-        if include_alternatives:
+        if args.include_alternatives:
             try:
-                fingerings = generate_chord_fingerings(chord_symbol, max_results=5)
+                fingerings = _cached_fingerings(args.chord_symbol, 5)
                 results["fingerings"] = [format_fingering_for_output(f) for f in fingerings]
                 
                 summary_lines.append("🎯 Guitar Fingerings:")
                 for i, fingering in enumerate(fingerings, 1):
-                    summary_lines.append(f"  {i}. {str(fingering)}")
+                    summary_lines.append(f"  {i}. {fingering}")
                     
                     characteristics = []
                     if fingering.characteristics.get("is_barre_chord"):
@@ -482,46 +805,35 @@ async def handle_get_chord_info(arguments: Dict[str, Any]) -> List[types.TextCon
                 summary_lines.append(f"❌ Fingering generation error: {str(e)}")
         
         summary_text = "\n".join(summary_lines)
-        json_data = json.dumps(results, indent=2)
+        json_data = _dumps(results)
         
         return [
             TextContent(type="text", text=summary_text),
-            TextContent(type="text", text=f"\nDetailed JSON data:\n```json\n{json_data}\n```")
+            _json_resource("get_chord_info", json_data)
         ]
         
     except Exception as e:
-        logger.error(f"Error getting chord info for {chord_symbol}: {e}")
+        logger.error("Error getting chord info for %s: %s", args.chord_symbol, e)
         return [TextContent(type="text", text=f"Error getting chord info: {str(e)}")]
 
 
 async def handle_create_diagram(arguments: Dict[str, Any]) -> List[types.TextContent | types.ImageContent]:
     """Handle create_chord_diagram tool (supports single or multiple chord diagrams)"""
-    fingering_specs = arguments["fingering_specs"]
-    columns = arguments.get("columns", 4)
-    format_type = arguments.get("format", "png")
-    dpi = arguments.get("dpi", 150)
-    include_names = arguments.get("include_names", True)
-    file_path = arguments.get("file_path")
+    args = CreateDiagramArgs.from_arguments(arguments)
     
     try:
         fingerings = []
         failed_items = []
         
         # Create fingerings from specifications
-        from src.fretboard import FretPosition, Fretboard
-        from src.music_theory import Note
-        from src.fingering import FingerAssignment
-        
-        fretboard = Fretboard()
-        
-        for i, spec in enumerate(fingering_specs):
+        for i, spec in enumerate(args.fingering_specs):
             try:
                 positions = []
                 finger_assignments = {}
                 
                 for pos in spec["positions"]:
-                    # Get the note at this position
-                    note = fretboard.get_note_at_position(pos["string"], pos["fret"])
+                    # Get the note at this position (out-of-range positions fail this spec only)
+                    note = _note_at(pos["string"], pos["fret"])
                     positions.append(FretPosition(string=pos["string"], fret=pos["fret"], note=note))
                     
                     # Handle finger assignment if provided
@@ -543,21 +855,10 @@ async def handle_create_diagram(arguments: Dict[str, Any]) -> List[types.TextCon
                 fingering = Fingering(positions=positions, finger_assignments=finger_assignments)
                 
                 # Set chord name if provided and include_names is True
-                if include_names and "chord_name" in spec:
-                    # Create a simple chord name wrapper for the diagram generator
-                    class ChordNameWrapper:
-                        def __init__(self, name):
-                            self.name = name
-                        def __str__(self):
-                            return self.name
-                    fingering.chord = ChordNameWrapper(spec["chord_name"])
-                elif include_names:
-                    class ChordNameWrapper:
-                        def __init__(self, name):
-                            self.name = name
-                        def __str__(self):
-                            return self.name
-                    fingering.chord = ChordNameWrapper(f"Chord {i+1}")
+                if args.include_names and "chord_name" in spec:
+                    fingering.chord = ChordLabel(spec["chord_name"])
+                elif args.include_names:
+                    fingering.chord = ChordLabel(f"Chord {i+1}")
                 
                 fingerings.append(fingering)
                 
@@ -570,57 +871,70 @@ async def handle_create_diagram(arguments: Dict[str, Any]) -> List[types.TextCon
                 error_msg += f". Failures: {'; '.join(failed_items)}"
             return [TextContent(type="text", text=error_msg)]
         
-        # Generate batch diagram
-        diagram_generator = ChordDiagramGenerator()
-        image_bytes = diagram_generator.generate_multiple_diagrams(
-            fingerings=fingerings,
-            cols=columns,
-            format=format_type,
-            dpi=dpi
-        )
+        # Reuse a previously rendered diagram when the same grid was requested before
+        cache_key = _diagram_cache_key(fingerings, args.columns, args.format, args.dpi, args.include_names)
+        loop = asyncio.get_running_loop()
+        image_bytes = await loop.run_in_executor(_cpu_pool, _read_cached_diagram, cache_key, args.format)
         
-        if not image_bytes:
-            return [TextContent(type="text", text="Failed to generate batch diagram")]
+        if image_bytes is None:
+            # Generate batch diagram off the event loop
+            image_bytes = await _render_shared(
+                cache_key, fingerings, args.columns, args.format, args.dpi
+            )
+            
+            if not image_bytes:
+                return [TextContent(type="text", text="Failed to generate batch diagram")]
+            
+            await loop.run_in_executor(_cpu_pool, _write_cached_diagram, cache_key, args.format, image_bytes)
         
         # Prepare response message
         success_msg = f"Generated batch diagram with {len(fingerings)} chord(s)"
         if failed_items:
             success_msg += f". Failed items: {'; '.join(failed_items)}"
         
-        if file_path:
+        if args.file_path:
             # Write to file
             try:
-                with open(file_path, 'wb') as f:
+                with open(args.file_path, 'wb') as f:
                     f.write(image_bytes)
                 return [TextContent(
                     type="text", 
-                    text=f"{success_msg} and saved to {file_path}"
+                    text=f"{success_msg} and saved to {args.file_path}"
                 )]
             except Exception as e:
                 return [TextContent(
                     type="text", 
-                    text=f"Error saving batch diagram to {file_path}: {str(e)}"
+                    text=f"Error saving batch diagram to {args.file_path}: {str(e)}"
                 )]
         else:
             # Return base64 data
-            base64_data = base64.b64encode(image_bytes).decode('utf-8')
+            base64_data = base64.b64encode(image_bytes).decode('ascii')
             
             response = [
                 TextContent(type="text", text=success_msg),
                 ImageContent(
                     type="image",
                     data=base64_data,
-                    mimeType=f"image/{format_type}"
+                    mimeType=f"image/{args.format}"
                 )
             ]
             
             return response
         
     except Exception as e:
-        logger.error(f"Error generating batch diagram: {e}")
+        logger.error("Error generating batch diagram: %s", e)
         return [TextContent(type="text", text=f"Error generating batch diagram: {str(e)}")]
 
 
+# Tool name -> handler coroutine used by handle_call_tool
+_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[Any]]]] = {
+    "generate_chord_fingerings": handle_generate_fingerings,
+    "analyze_chord_progression": handle_analyze_progression,
+    "get_chord_info": handle_get_chord_info,
+    "create_chord_diagram": handle_create_diagram,
+}
+
+
 async def main():
     """Main entry point for MCP server"""
     # Import here to avoid circular imports during testing
@@ -628,19 +942,22 @@ async def main():
     
     logger.info("Starting Guitar Chord Generator MCP Server")
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="guitar-chord-generator",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="guitar-chord-generator",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        _shutdown_render_pool()
 
 
 def run_server():
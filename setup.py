@@ -40,6 +40,7 @@ setup(
         'matplotlib>=3.5.0',
         'click>=8.0.0',
         'mcp>=1.12.0',
+        'jsonschema>=4.0.0',
     ],
     
     # Python version requirement
@@ -13,10 +13,23 @@ from .fretboard import FretPosition, GuitarTuning, Fretboard, STANDARD_TUNING, D
 from .fingering import Fingering, FingerAssignment, FingeringValidator
 from .fingering_generator import FingeringGenerator, GenerationConfig, generate_chord_fingerings
 from .chord_patterns import ChordPattern, ChordPatternDatabase, CHORD_PATTERNS
-from .diagram_generator import (
-    ChordDiagramGenerator, DiagramStyle, generate_chord_diagram, 
-    generate_chord_progression_diagram
-)
+
+# Diagram support pulls in matplotlib, so it is imported on first access
+_LAZY_DIAGRAM_NAMES = {
+    "ChordDiagramGenerator",
+    "DiagramStyle",
+    "generate_chord_diagram",
+    "generate_chord_progression_diagram",
+}
+
+
+def __getattr__(name):
+    """Import diagram names from diagram_generator on first access."""
+    if name in _LAZY_DIAGRAM_NAMES:
+        from . import diagram_generator
+        return getattr(diagram_generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Note",
@@ -11,29 +11,36 @@ This module handles parsing of chord symbols like:
 """
 
 import re
-from typing import Optional, List, Dict, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Dict, Sequence, Tuple
 
 from .music_theory import Note, Chord, ChordQuality
 
 
-@dataclass
 class ParsedChordComponents:
-    """Intermediate representation of parsed chord components"""
-    root: str
-    quality: str = ""
-    extensions: List[str] = None
-    alterations: List[str] = None
-    added_tones: List[str] = None
-    bass: str = ""
-    
-    def __post_init__(self):
-        if self.extensions is None:
-            self.extensions = []
-        if self.alterations is None:
-            self.alterations = []
-        if self.added_tones is None:
-            self.added_tones = []
+    """Intermediate representation of parsed chord components
+    
+    Short-lived (one per parse), so it uses __slots__ and empty tuples as
+    defaults instead of allocating a dict and three lists every time.
+    """
+    __slots__ = ('root', 'quality', 'extensions', 'alterations', 'added_tones', 'bass')
+    
+    def __init__(self, root: str, quality: str = "",
+                 extensions: Sequence[int] = (),
+                 alterations: Sequence[str] = (),
+                 added_tones: Sequence[str] = (),
+                 bass: str = ""):
+        self.root = root
+        self.quality = quality
+        self.extensions = extensions
+        self.alterations = alterations
+        self.added_tones = added_tones
+        self.bass = bass
+    
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ParsedChordComponents({fields})"
 
 
 class ChordParseError(Exception):
@@ -41,6 +48,86 @@ class ChordParseError(Exception):
     pass
 
 
+# Qualities that already include a seventh
+_SEVENTH_QUALITIES = frozenset({
+    ChordQuality.DOMINANT_SEVENTH, ChordQuality.MAJOR_SEVENTH,
+    ChordQuality.MINOR_SEVENTH, ChordQuality.DIMINISHED_SEVENTH,
+    ChordQuality.HALF_DIMINISHED, ChordQuality.MINOR_MAJOR_SEVENTH,
+})
+
+# Seventh chord quality implied by a quality string followed by a 7
+_EXT7_QUALITY = {
+    '': ChordQuality.DOMINANT_SEVENTH,
+    '7': ChordQuality.DOMINANT_SEVENTH,
+    'M': ChordQuality.MAJOR_SEVENTH,
+    'maj': ChordQuality.MAJOR_SEVENTH,
+    'major': ChordQuality.MAJOR_SEVENTH,
+    '△': ChordQuality.MAJOR_SEVENTH,
+    'm': ChordQuality.MINOR_SEVENTH,
+    'min': ChordQuality.MINOR_SEVENTH,
+    'minor': ChordQuality.MINOR_SEVENTH,
+    '-': ChordQuality.MINOR_SEVENTH,
+    'dim': ChordQuality.DIMINISHED_SEVENTH,
+    'm7b5': ChordQuality.HALF_DIMINISHED,
+    'ø': ChordQuality.HALF_DIMINISHED,
+    'mM7': ChordQuality.MINOR_MAJOR_SEVENTH,
+    'mMaj7': ChordQuality.MINOR_MAJOR_SEVENTH,
+    'm△7': ChordQuality.MINOR_MAJOR_SEVENTH,
+}
+
+# Characters a chord symbol can start with
+_ROOT_LETTERS = frozenset('ABCDEFGabcdefg')
+
+# Notes for every root/bass spelling the patterns accept ([A-G][#b]?, matched
+# case-insensitively). Notes are immutable, so parsed chords can share them.
+_NOTE_CACHE: Dict[str, Note] = {
+    spelling: Note.from_name(spelling)
+    for letter in 'ABCDEFGabcdefg'
+    for spelling in (letter, letter + '#', letter + 'b', letter + 'B')
+}
+
+
+def _lengths_by_first_char(spellings) -> Dict[str, Tuple[int, ...]]:
+    """Map each first character to the lengths of spellings starting with it, longest first"""
+    lengths: Dict[str, set] = {}
+    for spelling in spellings:
+        lengths.setdefault(spelling[0], set()).add(len(spelling))
+    return {first: tuple(sorted(sizes, reverse=True)) for first, sizes in lengths.items()}
+
+
+def _compile_chord_pattern(quality_alternation: str) -> re.Pattern:
+    """Compile the full chord symbol pattern for the given quality alternation"""
+    
+    # Root note pattern (handles sharps, flats, and enharmonics)
+    # More restrictive to only allow valid note names
+    root_pattern = r'[A-G][#b]?'
+    
+    # Quality pattern (handles various notations) - escape special regex characters
+    quality_options = quality_alternation.replace('+', r'\+')
+    quality_pattern = f'({quality_options})?'
+    
+    # Extension pattern (7, 9, 11, 13)
+    extension_pattern = r'(\d+)?'
+    
+    # Alteration pattern (#5, b9, #11, etc.), capturing the whole run
+    alteration_pattern = r'((?:[#b]\d+)*)'
+    
+    # Added tone pattern (add9, add11, etc.), capturing the whole run
+    add_pattern = r'((?:add\d+|\(add\d+\))*)'
+    
+    # Alternative patterns
+    alt_pattern = r'(alt)?'
+    
+    # Bass note pattern for slash chords
+    bass_pattern = f'(?:/({root_pattern}))?'
+    
+    # Complete chord pattern
+    return re.compile(
+        f'^({root_pattern}){quality_pattern}{extension_pattern}{alteration_pattern}{add_pattern}{alt_pattern}{bass_pattern}$',
+        re.IGNORECASE
+    )
+
+
 class ChordParser:
     """
     Parses chord symbols into structured Chord objects.
@@ -54,8 +141,8 @@ class ChordParser:
     - Slash chords: C/E, Dm7/G
     """
     
-    # Quality mappings for different notation styles
-    QUALITY_MAPPINGS = {
+    # Quality mappings for different notation styles (read-only)
+    QUALITY_MAPPINGS = MappingProxyType({
         # Major variants
         '': ChordQuality.MAJOR,
         'M': ChordQuality.MAJOR,
@@ -124,50 +211,26 @@ class ChordParser:
         'M9': ChordQuality.MAJOR_NINTH,
         'maj9': ChordQuality.MAJOR_NINTH,
         '△9': ChordQuality.MAJOR_NINTH,
-    }
+    })
     
-    def __init__(self):
-        """Initialize the chord parser with regex patterns"""
-        self._compile_patterns()
+    # Non-empty quality spellings, longest first (the order the regex
+    # alternation tries them), sorted once when the class is created
+    _QUALITY_ALTERNATION = '|'.join(sorted((k for k in QUALITY_MAPPINGS if k), key=len, reverse=True))
     
-    def _compile_patterns(self):
-        """Compile regex patterns for parsing chord symbols"""
-        
-        # Root note pattern (handles sharps, flats, and enharmonics)
-        # More restrictive to only allow valid note names
-        root_pattern = r'[A-G][#b]?'
-        
-        # Quality pattern (handles various notations) - filter out empty string and escape special chars
-        quality_keys = [k for k in self.QUALITY_MAPPINGS.keys() if k]  # Remove empty string
-        quality_options = '|'.join(sorted(quality_keys, key=len, reverse=True))
-        # Escape special regex characters
-        quality_options = quality_options.replace('°', r'°').replace('△', r'△').replace('+', r'\+') 
-        quality_pattern = f'({quality_options})?'
-        
-        # Extension pattern (7, 9, 11, 13)
-        extension_pattern = r'(\d+)?'
-        
-        # Alteration pattern (#5, b9, #11, etc.)
-        alteration_pattern = r'([#b]\d+)*'
-        
-        # Added tone pattern (add9, add11, etc.)
-        add_pattern = r'(add\d+|\(add\d+\))*'
-        
-        # Alternative patterns
-        alt_pattern = r'(alt)?'
-        
-        # Bass note pattern for slash chords
-        bass_pattern = f'(?:/({root_pattern}))?'
-        
-        # Complete chord pattern
-        self.chord_pattern = re.compile(
-            f'^({root_pattern}){quality_pattern}{extension_pattern}{alteration_pattern}{add_pattern}{alt_pattern}{bass_pattern}$',
-            re.IGNORECASE
-        )
-        
-        # Specific patterns for complex parsing
-        self.alteration_sub_pattern = re.compile(r'([#b])(\d+)', re.IGNORECASE)
-        self.add_sub_pattern = re.compile(r'add(\d+)|\(add(\d+)\)', re.IGNORECASE)
+    # Lowercased quality spellings, plus the lengths of the spellings that
+    # start with each (lowercase) character, longest first. The regex captures
+    # the matched text itself, so the tokenizer only needs the longest spelling
+    # that matches case-insensitively at a position.
+    _QUALITY_SPELLINGS = frozenset(k.lower() for k in QUALITY_MAPPINGS if k)
+    _QUALITY_LENGTHS_BY_FIRST = _lengths_by_first_char(_QUALITY_SPELLINGS)
+    
+    # Regex patterns, compiled once when the class is created
+    chord_pattern = _compile_chord_pattern(_QUALITY_ALTERNATION)
+    alteration_sub_pattern = re.compile(r'([#b])(\d+)', re.IGNORECASE)
+    add_sub_pattern = re.compile(r'add(\d+)|\(add(\d+)\)', re.IGNORECASE)
+    
+    # Parsers hold no per-instance state
+    __slots__ = ()
     
     def parse(self, chord_symbol: str) -> Chord:
         """
@@ -188,21 +251,158 @@ class ChordParser:
         # Clean the input
         chord_symbol = chord_symbol.strip()
         
-        # Try to match the chord pattern
-        match = self.chord_pattern.match(chord_symbol)
-        if not match:
+        groups = self._match_groups(chord_symbol)
+        if groups is None:
             raise ChordParseError(f"Cannot parse chord symbol: {chord_symbol}")
         
         try:
-            components = self._extract_components(match, chord_symbol)
+            components = self._extract_components(groups)
             return self._build_chord(components)
         except Exception as e:
             raise ChordParseError(f"Error parsing '{chord_symbol}': {str(e)}")
     
-    def _extract_components(self, match: re.Match, original: str) -> ParsedChordComponents:
-        """Extract chord components from regex match"""
-        groups = match.groups()
+    def _match_groups(self, chord_symbol: str) -> Optional[Tuple[Optional[str], ...]]:
+        """Split a cleaned symbol into pattern groups, or return None if it doesn't match"""
+        # Tokenize directly, falling back to the full regex for anything the
+        # single-pass tokenizer can't decide on its own
+        groups = self._tokenize(chord_symbol)
+        if groups is None:
+            match = self.chord_pattern.match(chord_symbol)
+            if not match:
+                return None
+            groups = match.groups()
+        return groups
+    
+    def _try_parse(self, chord_symbol: str) -> Optional[Chord]:
+        """Parse a chord symbol, returning None instead of raising on failure"""
+        if not chord_symbol or not isinstance(chord_symbol, str):
+            return None
+        
+        chord_symbol = chord_symbol.strip()
+        if chord_symbol[:1] not in _ROOT_LETTERS:
+            return None
+        
+        groups = self._match_groups(chord_symbol)
+        if groups is None:
+            return None
+        
+        try:
+            return self._build_chord(self._extract_components(groups))
+        except Exception:
+            return None
+    
+    def parse_many(self, chord_symbols: Sequence[str]) -> List[Chord]:
+        """
+        Parse a sequence of chord symbols, parsing each distinct symbol once.
         
+        Args:
+            chord_symbols: Chord symbols, e.g. the chords of a song chart
+        
+        Returns:
+            Chord objects in input order; repeated symbols share one Chord
+        
+        Raises:
+            ChordParseError: If any of the symbols cannot be parsed
+        """
+        parsed = {symbol: self.parse(symbol) for symbol in dict.fromkeys(chord_symbols)}
+        return [parsed[symbol] for symbol in chord_symbols]
+    
+    def _tokenize(self, chord_symbol: str) -> Optional[Tuple[str, ...]]:
+        """
+        Split a chord symbol into the same groups as chord_pattern in one pass.
+        
+        Each component is matched greedily, case-insensitively and in the
+        same order as the regex tries its alternatives, so whenever this
+        succeeds the regex would have matched identically without
+        backtracking. Returns None when that first-choice path doesn't
+        consume the whole symbol (or the symbol has unexpected characters);
+        the caller then falls back to the regex.
+        
+        Returns:
+            (root, quality, extension, alterations, added_tones, alt, bass)
+        """
+        if not chord_symbol.isascii() and any(
+                not ch.isascii() and ch not in '△°ø' for ch in chord_symbol):
+            return None
+        
+        lower = chord_symbol.lower()
+        length = len(lower)
+        
+        # Root note: [A-G][#b]?
+        if not length or lower[0] not in 'abcdefg':
+            return None
+        pos = 2 if length > 1 and lower[1] in '#b' else 1
+        root = chord_symbol[:pos]
+        
+        # Quality: longest matching spelling
+        quality = ''
+        spellings = self._QUALITY_SPELLINGS
+        for size in self._QUALITY_LENGTHS_BY_FIRST.get(lower[pos:pos + 1], ()):
+            if pos + size <= length and lower[pos:pos + size] in spellings:
+                quality = chord_symbol[pos:pos + size]
+                pos += size
+                break
+        
+        # Extension: a run of digits
+        end = pos
+        while end < length and lower[end].isdigit():
+            end += 1
+        extension = chord_symbol[pos:end]
+        pos = end
+        
+        # Alterations: repeated [#b] + digits
+        start_run = pos
+        while pos < length and lower[pos] in '#b':
+            end = pos + 1
+            while end < length and lower[end].isdigit():
+                end += 1
+            if end == pos + 1:
+                break
+            pos = end
+        alterations = chord_symbol[start_run:pos]
+        
+        # Added tones: repeated add<digits> or (add<digits>)
+        start_run = pos
+        while True:
+            if lower.startswith('add', pos):
+                start = pos + 3
+            elif lower.startswith('(add', pos):
+                start = pos + 4
+            else:
+                break
+            end = start
+            while end < length and lower[end].isdigit():
+                end += 1
+            if end == start:
+                break
+            if lower[pos] == '(':
+                if end >= length or lower[end] != ')':
+                    break
+                end += 1
+            pos = end
+        added_tones = chord_symbol[start_run:pos]
+        
+        # Altered dominant shorthand
+        alt = ''
+        if lower.startswith('alt', pos):
+            alt = chord_symbol[pos:pos + 3]
+            pos += 3
+        
+        # Bass note for slash chords
+        bass = ''
+        if pos < length and lower[pos] == '/':
+            if pos + 1 >= length or lower[pos + 1] not in 'abcdefg':
+                return None
+            end = pos + 3 if pos + 2 < length and lower[pos + 2] in '#b' else pos + 2
+            bass = chord_symbol[pos + 1:end]
+            pos = end
+        
+        if pos != length:
+            return None
+        return root, quality, extension, alterations, added_tones, alt, bass
+    
+    def _extract_components(self, groups: Tuple[Optional[str], ...]) -> ParsedChordComponents:
+        """Extract chord components from matched groups"""
         root = groups[0] if groups[0] else ""
         quality = groups[1] if groups[1] else ""
         extension = groups[2] if groups[2] else ""
@@ -211,35 +411,31 @@ class ChordParser:
         alt_str = groups[5] if groups[5] else ""
         bass = groups[6] if groups[6] else ""
         
-        # Parse alterations
-        alterations = []
+        # Parse alterations (lists are only built when there is something to add)
+        alterations = ()
         if alterations_str:
-            for alt_match in self.alteration_sub_pattern.finditer(alterations_str):
-                alteration = alt_match.group(1) + alt_match.group(2)
-                alterations.append(alteration)
+            alterations = [alt_match.group(1) + alt_match.group(2)
+                           for alt_match in self.alteration_sub_pattern.finditer(alterations_str)]
         
         # Handle "alt" keyword (shorthand for altered dominant)
         if alt_str.lower() == 'alt':
-            alterations.extend(['b9', '#9', '#11', 'b13'])
+            alterations = [*alterations, 'b9', '#9', '#11', 'b13']
         
         # Parse added tones
-        added_tones = []
+        added_tones = ()
         if add_str:
-            for add_match in self.add_sub_pattern.finditer(add_str):
-                # Handle both add9 and (add9) formats
-                tone = add_match.group(1) or add_match.group(2)
-                if tone:
-                    added_tones.append(tone)
+            # Handle both add9 and (add9) formats
+            added_tones = [tone for add_match in self.add_sub_pattern.finditer(add_str)
+                           if (tone := add_match.group(1) or add_match.group(2))]
         
         # Handle extensions (9, 11, 13 imply 7th)
-        extensions = []
+        extensions = ()
         if extension:
             ext_num = int(extension)
-            if ext_num in [9, 11, 13]:
-                extensions.append(7)  # Implied 7th
-                extensions.append(ext_num)
+            if ext_num in (9, 11, 13):
+                extensions = (7, ext_num)  # Implied 7th
             elif ext_num == 7:
-                extensions.append(7)
+                extensions = (7,)
         
         return ParsedChordComponents(
             root=root,
@@ -254,10 +450,12 @@ class ChordParser:
         """Build a Chord object from parsed components"""
         
         # Parse root note
-        try:
-            root_note = Note.from_name(components.root)
-        except ValueError as e:
-            raise ChordParseError(f"Invalid root note: {components.root}")
+        root_note = _NOTE_CACHE.get(components.root)
+        if root_note is None:
+            try:
+                root_note = Note.from_name(components.root)
+            except ValueError as e:
+                raise ChordParseError(f"Invalid root note: {components.root}")
         
         # Determine chord quality
         chord_quality = self._determine_quality(components)
@@ -265,16 +463,15 @@ class ChordParser:
         # Parse bass note for slash chords
         bass_note = None
         if components.bass:
-            try:
-                bass_note = Note.from_name(components.bass)
-            except ValueError as e:
-                raise ChordParseError(f"Invalid bass note: {components.bass}")
+            bass_note = _NOTE_CACHE.get(components.bass)
+            if bass_note is None:
+                try:
+                    bass_note = Note.from_name(components.bass)
+                except ValueError as e:
+                    raise ChordParseError(f"Invalid bass note: {components.bass}")
         
-        # Process alterations
-        alterations = {}
-        for alt_str in components.alterations:
-            interval, alteration = self._parse_alteration(alt_str)
-            alterations[interval] = alteration
+        # Process alterations ({interval: "#" or "b"})
+        alterations = dict(map(self._parse_alteration, components.alterations))
         
         # Process added tones
         added_tones = []
@@ -287,7 +484,7 @@ class ChordParser:
         return Chord(
             root=root_note,
             quality=chord_quality,
-            extensions=components.extensions,
+            extensions=list(components.extensions),
             alterations=alterations,
             bass=bass_note,
             added_tones=added_tones
@@ -299,32 +496,19 @@ class ChordParser:
         quality_str = components.quality
         
         # Check for explicit seventh chord qualities first
-        if quality_str in self.QUALITY_MAPPINGS:
-            mapped_quality = self.QUALITY_MAPPINGS[quality_str]
-            # If it's already a seventh chord quality, use it
-            if mapped_quality in [ChordQuality.DOMINANT_SEVENTH, ChordQuality.MAJOR_SEVENTH, 
-                                 ChordQuality.MINOR_SEVENTH, ChordQuality.DIMINISHED_SEVENTH,
-                                 ChordQuality.HALF_DIMINISHED, ChordQuality.MINOR_MAJOR_SEVENTH]:
-                return mapped_quality
+        mapped_quality = self.QUALITY_MAPPINGS.get(quality_str)
+        if mapped_quality in _SEVENTH_QUALITIES:
+            return mapped_quality
         
         # Handle cases where extension implies seventh chord quality
         if 7 in components.extensions:
-            if quality_str == '' or quality_str == '7':
-                return ChordQuality.DOMINANT_SEVENTH
-            elif quality_str in ['M', 'maj', 'major', '△']:
-                return ChordQuality.MAJOR_SEVENTH
-            elif quality_str in ['m', 'min', 'minor', '-']:
-                return ChordQuality.MINOR_SEVENTH
-            elif quality_str == 'dim':
-                return ChordQuality.DIMINISHED_SEVENTH
-            elif quality_str in ['m7b5', 'ø']:
-                return ChordQuality.HALF_DIMINISHED
-            elif quality_str in ['mM7', 'mMaj7', 'm△7']:
-                return ChordQuality.MINOR_MAJOR_SEVENTH
+            seventh_quality = _EXT7_QUALITY.get(quality_str)
+            if seventh_quality is not None:
+                return seventh_quality
         
         # Use quality mapping for basic qualities
-        if quality_str in self.QUALITY_MAPPINGS:
-            return self.QUALITY_MAPPINGS[quality_str]
+        if mapped_quality is not None:
+            return mapped_quality
         
         # Default to major if no quality specified
         return ChordQuality.MAJOR
@@ -355,11 +539,7 @@ class ChordParser:
         Returns:
             True if the symbol can be parsed, False otherwise
         """
-        try:
-            self.parse(chord_symbol)
-            return True
-        except ChordParseError:
-            return False
+        return self._try_parse(chord_symbol) is not None
     
     def get_parsing_suggestions(self, chord_symbol: str) -> List[str]:
         """
@@ -371,29 +551,8 @@ class ChordParser:
         Returns:
             List of suggested corrections
         """
-        suggestions = []
-        
-        # Common typos and corrections
-        common_corrections = {
-            'maj': ['M', 'maj7', '△'],
-            'min': ['m', 'min7', '-'],
-            'dom': ['7', 'dom7'],
-            '°': ['dim', 'dim7'],
-            'ø': ['m7b5', 'ø7'],
-            '+': ['aug', '#5'],
-        }
-        
-        # Try common note name corrections
-        if len(chord_symbol) >= 1:
-            first_char = chord_symbol[0].upper()
-            if first_char in 'ABCDEFG':
-                # Try different quality variations
-                for quality in ['', 'm', '7', 'maj7', 'm7']:
-                    suggestion = first_char + quality
-                    if self.validate_chord_symbol(suggestion):
-                        suggestions.append(suggestion)
-        
-        return suggestions[:5]  # Return top 5 suggestions
+        # Offer common chords on the same root letter
+        return list(_COMMON_CHORDS.get(chord_symbol[:1].upper(), ()))[:5]  # Return top 5 suggestions
 
 
 # Convenience function for direct parsing
@@ -410,13 +569,38 @@ def parse_chord(chord_symbol: str) -> Chord:
     Raises:
         ChordParseError: If parsing fails
     """
-    parser = ChordParser()
-    return parser.parse(chord_symbol)
+    return _default_parser.parse(chord_symbol)
 
 
 # Pre-defined parser instance for efficiency
 _default_parser = ChordParser()
 
-def quick_parse(chord_symbol: str) -> Chord:
-    """Quick parsing using a pre-initialized parser instance"""
+# Suggestions for each root letter: the root with a few common qualities
+_COMMON_CHORDS: Dict[str, Tuple[str, ...]] = {
+    letter: tuple(letter + quality for quality in ('', 'm', '7', 'maj7', 'm7')
+                  if _default_parser.validate_chord_symbol(letter + quality))
+    for letter in 'ABCDEFG'
+}
+
+
+@lru_cache(maxsize=4096)
+def _cached_parse(chord_symbol: str) -> Chord:
+    """Parse with the default parser, memoized by symbol (failures aren't cached)"""
     return _default_parser.parse(chord_symbol)
+
+
+def _parse_cache_clear() -> None:
+    """Clear the quick_parse cache"""
+    _cached_parse.cache_clear()
+
+
+def quick_parse(chord_symbol: str) -> Chord:
+    """
+    Quick parsing using a pre-initialized parser instance.
+    
+    Results are cached per symbol, so repeated symbols return the same
+    Chord object; treat it as read-only.
+    """
+    if not isinstance(chord_symbol, str):
+        return _default_parser.parse(chord_symbol)
+    return _cached_parse(chord_symbol)
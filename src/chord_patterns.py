@@ -5,9 +5,12 @@ This module contains databases of well-known chord patterns that can be
 used to enhance fingering generation with familiar, learnable chord shapes.
 """
 
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+import heapq
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, Optional
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 from .music_theory import Note, ChordQuality
 from .fretboard import FretPosition, Fretboard, STANDARD_TUNING
@@ -22,7 +25,20 @@ class PatternType(Enum):
     JAZZ = "jazz"           # Common jazz voicings
 
 
-@dataclass
+# Read-only finger assignment mappings, shared by every pattern that uses the same fingers
+_FINGER_INTERN: Dict[frozenset, Mapping[int, FingerAssignment]] = {}
+
+
+def _intern_finger_assignments(assignments: Mapping[int, FingerAssignment]) -> Mapping[int, FingerAssignment]:
+    """Return the shared read-only mapping equal to assignments"""
+    key = frozenset(assignments.items())
+    interned = _FINGER_INTERN.get(key)
+    if interned is None:
+        interned = _FINGER_INTERN[key] = MappingProxyType(dict(assignments))
+    return interned
+
+
+@dataclass(frozen=True, slots=True)
 class ChordPattern:
     """
     Represents a chord pattern/shape that can be transposed.
@@ -35,15 +51,821 @@ class ChordPattern:
         root_fret: Fret where root is located in this pattern
         finger_assignments: Suggested finger assignments
         pattern_type: Type of pattern (open, barre, etc.)
+        sounding_mask: Bitmask of sounding strings (bit n-1 set if string n is played)
+        root_pc: Pitch class (0-11) of the root in standard tuning
     """
     name: str
     quality: ChordQuality
-    frets: List[Optional[int]]  # 6 elements, string 6 to string 1
+    frets: Tuple[Optional[int], ...]  # 6 elements, string 6 to string 1
     root_string: int
     root_fret: int
-    finger_assignments: Dict[int, FingerAssignment]
+    finger_assignments: Mapping[int, FingerAssignment]
     pattern_type: PatternType
     difficulty: float = 0.0
+    sounding_mask: int = field(default=0, init=False, repr=False, compare=False)
+    root_pc: int = field(default=0, init=False, repr=False, compare=False)
+    # Fret positions, filled in the first time the pattern is turned into a fingering
+    _positions: Optional[Tuple[FretPosition, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Freeze the fret list and finger assignments and derive the cached attributes"""
+        object.__setattr__(self, 'frets', tuple(self.frets))
+        object.__setattr__(self, 'finger_assignments', _intern_finger_assignments(self.finger_assignments))
+        # frets[0] is string 6, so index i is string 6 - i (bit 5 - i)
+        object.__setattr__(self, 'sounding_mask',
+                           sum(1 << (5 - i) for i, fret in enumerate(self.frets) if fret is not None))
+        open_pc = STANDARD_TUNING.get_open_note(self.root_string).pitch_class
+        object.__setattr__(self, 'root_pc', (open_pc + self.root_fret) % 12)
+    
+    def __hash__(self) -> int:
+        """Hash on the shape's identity (finger assignments are a mapping, so not hashable)"""
+        return hash((self.name, self.quality, self.frets, self.root_string, self.root_fret, self.pattern_type))
+    
+    @property
+    def num_voices(self) -> int:
+        """Number of strings played by this pattern"""
+        return self.sounding_mask.bit_count()
+    
+    def sounds_strings(self, string_mask: int) -> bool:
+        """Check whether every string in string_mask (bit n-1 = string n) is played"""
+        return self.sounding_mask & string_mask == string_mask
+
+
+# Open position major chords
+_OPEN_MAJOR_PATTERNS = (
+    # C major (x-3-2-0-1-0)
+    ChordPattern(
+        name="open_C_major",
+        quality=ChordQuality.MAJOR,
+        frets=(None, 3, 2, 0, 1, 0),  # x-3-2-0-1-0
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.RING,    # 3rd fret
+            4: FingerAssignment.MIDDLE,  # 2nd fret
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # G major (3-2-0-0-3-3)
+    ChordPattern(
+        name="open_G_major",
+        quality=ChordQuality.MAJOR,
+        frets=(3, 2, 0, 0, 3, 3),  # 3-2-0-0-3-3
+        root_string=6,  # Root G on 6th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            6: FingerAssignment.MIDDLE,  # 3rd fret
+            5: FingerAssignment.INDEX,   # 2nd fret
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.RING,    # 3rd fret
+            1: FingerAssignment.PINKY,   # 3rd fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # D major (x-x-0-2-3-2)
+    ChordPattern(
+        name="open_D_major",
+        quality=ChordQuality.MAJOR,
+        frets=(None, None, 0, 2, 3, 2),  # x-x-0-2-3-2
+        root_string=4,  # Root D on 4th string, open
+        root_fret=0,
+        finger_assignments={
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.INDEX,   # 2nd fret
+            2: FingerAssignment.RING,    # 3rd fret
+            1: FingerAssignment.MIDDLE,  # 2nd fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # A major (x-0-2-2-2-0)
+    ChordPattern(
+        name="open_A_major",
+        quality=ChordQuality.MAJOR,
+        frets=(None, 0, 2, 2, 2, 0),  # x-0-2-2-2-0
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.INDEX,   # 2nd fret
+            3: FingerAssignment.MIDDLE,  # 2nd fret
+            2: FingerAssignment.RING,    # 2nd fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # E major (0-2-2-1-0-0)
+    ChordPattern(
+        name="open_E_major",
+        quality=ChordQuality.MAJOR,
+        frets=(0, 2, 2, 1, 0, 0),  # 0-2-2-1-0-0
+        root_string=6,  # Root E on 6th string, open
+        root_fret=0,
+        finger_assignments={
+            6: FingerAssignment.OPEN,    # open
+            5: FingerAssignment.MIDDLE,  # 2nd fret
+            4: FingerAssignment.RING,    # 2nd fret
+            3: FingerAssignment.INDEX,   # 1st fret
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # F major (1-3-3-2-1-1) - E-shape barre chord
+    ChordPattern(
+        name="F_major_E_barre",
+        quality=ChordQuality.MAJOR,
+        frets=(1, 3, 3, 2, 1, 1),  # 1-3-3-2-1-1
+        root_string=6,  # Root F on 6th string, 1st fret
+        root_fret=1,
+        finger_assignments={
+            6: FingerAssignment.INDEX,   # 1st fret (barre)
+            5: FingerAssignment.RING,    # 3rd fret
+            4: FingerAssignment.PINKY,   # 3rd fret
+            3: FingerAssignment.MIDDLE,  # 2nd fret
+            2: FingerAssignment.INDEX,   # 1st fret (barre)
+            1: FingerAssignment.INDEX,   # 1st fret (barre)
+        },
+        pattern_type=PatternType.BARRE_E,
+        difficulty=0.5  # F barre is harder
+    ),
+    
+    # Bb major (x-1-3-3-3-1) - A-shape barre chord
+    ChordPattern(
+        name="Bb_major_A_barre",
+        quality=ChordQuality.MAJOR,
+        frets=(None, 1, 3, 3, 3, 1),  # x-1-3-3-3-1
+        root_string=5,  # Root Bb on 5th string, 1st fret
+        root_fret=1,
+        finger_assignments={
+            5: FingerAssignment.INDEX,   # 1st fret (barre)
+            4: FingerAssignment.MIDDLE,  # 3rd fret
+            3: FingerAssignment.RING,    # 3rd fret
+            2: FingerAssignment.PINKY,   # 3rd fret
+            1: FingerAssignment.INDEX,   # 1st fret (barre)
+        },
+        pattern_type=PatternType.BARRE_A,
+        difficulty=0.4  # A-shape barre
+    )
+)
+
+# Open position minor chords
+_OPEN_MINOR_PATTERNS = (
+    # A minor (x-0-2-2-1-0)
+    ChordPattern(
+        name="open_Am_minor",
+        quality=ChordQuality.MINOR,
+        frets=(None, 0, 2, 2, 1, 0),  # x-0-2-2-1-0
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.MIDDLE,  # 2nd fret
+            3: FingerAssignment.RING,    # 2nd fret
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # E minor (0-2-2-0-0-0)
+    ChordPattern(
+        name="open_Em_minor",
+        quality=ChordQuality.MINOR,
+        frets=(0, 2, 2, 0, 0, 0),  # 0-2-2-0-0-0
+        root_string=6,  # Root E on 6th string, open
+        root_fret=0,
+        finger_assignments={
+            6: FingerAssignment.OPEN,    # open
+            5: FingerAssignment.MIDDLE,  # 2nd fret
+            4: FingerAssignment.RING,    # 2nd fret
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Bbm (x-1-3-3-2-1) - A-shape minor barre chord
+    ChordPattern(
+        name="Bbm_minor_A_barre",
+        quality=ChordQuality.MINOR,
+        frets=(None, 1, 3, 3, 2, 1),  # x-1-3-3-2-1
+        root_string=5,  # Root Bb on 5th string, 1st fret
+        root_fret=1,
+        finger_assignments={
+            5: FingerAssignment.INDEX,   # 1st fret (barre)
+            4: FingerAssignment.RING,    # 3rd fret
+            3: FingerAssignment.PINKY,   # 3rd fret
+            2: FingerAssignment.MIDDLE,  # 2nd fret
+            1: FingerAssignment.INDEX,   # 1st fret (barre)
+        },
+        pattern_type=PatternType.BARRE_A,
+        difficulty=0.4  # A-shape minor barre
+    ),
+    
+    # Fm (1-3-3-1-1-1) - E-shape minor barre chord
+    ChordPattern(
+        name="Fm_minor_E_barre",
+        quality=ChordQuality.MINOR,
+        frets=(1, 3, 3, 1, 1, 1),  # 1-3-3-1-1-1
+        root_string=6,  # Root F on 6th string, 1st fret
+        root_fret=1,
+        finger_assignments={
+            6: FingerAssignment.INDEX,   # 1st fret (barre)
+            5: FingerAssignment.RING,    # 3rd fret
+            4: FingerAssignment.PINKY,   # 3rd fret
+            3: FingerAssignment.INDEX,   # 1st fret (barre)
+            2: FingerAssignment.INDEX,   # 1st fret (barre)
+            1: FingerAssignment.INDEX,   # 1st fret (barre)
+        },
+        pattern_type=PatternType.BARRE_E,
+        difficulty=0.5  # E-shape minor barre
+    ),
+    
+    # D minor (x-x-0-2-3-1)
+    ChordPattern(
+        name="open_Dm_minor",
+        quality=ChordQuality.MINOR,
+        frets=(None, None, 0, 2, 3, 1),  # x-x-0-2-3-1
+        root_string=4,  # Root D on 4th string, open
+        root_fret=0,
+        finger_assignments={
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.INDEX,   # 2nd fret
+            2: FingerAssignment.RING,    # 3rd fret
+            1: FingerAssignment.MIDDLE,  # 1st fret
+        },
+        pattern_type=PatternType.OPEN
+    )
+)
+
+# Seventh chord patterns
+_SEVENTH_PATTERNS = (
+    # G7 (3-2-0-0-0-1)
+    ChordPattern(
+        name="open_G7",
+        quality=ChordQuality.DOMINANT_SEVENTH,
+        frets=(3, 2, 0, 0, 0, 1),  # 3-2-0-0-0-1
+        root_string=6,  # Root G on 6th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            6: FingerAssignment.MIDDLE,  # 3rd fret
+            5: FingerAssignment.INDEX,   # 2nd fret
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.RING,    # 1st fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # C7 (x-3-2-3-1-0) - standard open C7 without 5th
+    ChordPattern(
+        name="open_C7",
+        quality=ChordQuality.DOMINANT_SEVENTH,
+        frets=(None, 3, 2, 3, 1, 0),  # x-3-2-3-1-0
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.RING,    # 3rd fret (C)
+            4: FingerAssignment.INDEX,   # 2nd fret (E)
+            3: FingerAssignment.PINKY,   # 3rd fret (Bb)
+            2: FingerAssignment.MIDDLE,  # 1st fret (C)
+            1: FingerAssignment.OPEN,    # open (E)
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # D7 (x-x-0-2-1-2)
+    ChordPattern(
+        name="open_D7",
+        quality=ChordQuality.DOMINANT_SEVENTH,
+        frets=(None, None, 0, 2, 1, 2),  # x-x-0-2-1-2
+        root_string=4,  # Root D on 4th string, open
+        root_fret=0,
+        finger_assignments={
+            4: FingerAssignment.OPEN,    # open (D)
+            3: FingerAssignment.MIDDLE,  # 2nd fret (A)
+            2: FingerAssignment.INDEX,   # 1st fret (C)
+            1: FingerAssignment.RING,    # 2nd fret (F#)
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # A7 (x-0-2-0-2-0)
+    ChordPattern(
+        name="open_A7",
+        quality=ChordQuality.DOMINANT_SEVENTH,
+        frets=(None, 0, 2, 0, 2, 0),  # x-0-2-0-2-0
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open (A)
+            4: FingerAssignment.MIDDLE,  # 2nd fret (E)
+            3: FingerAssignment.OPEN,    # open (G)
+            2: FingerAssignment.RING,    # 2nd fret (C#)
+            1: FingerAssignment.OPEN,    # open (E)
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # E7 (0-2-0-1-0-0)
+    ChordPattern(
+        name="open_E7",
+        quality=ChordQuality.DOMINANT_SEVENTH,
+        frets=(0, 2, 0, 1, 0, 0),  # 0-2-0-1-0-0
+        root_string=6,  # Root E on 6th string, open
+        root_fret=0,
+        finger_assignments={
+            6: FingerAssignment.OPEN,    # open (E)
+            5: FingerAssignment.MIDDLE,  # 2nd fret (B)
+            4: FingerAssignment.OPEN,    # open (D)
+            3: FingerAssignment.INDEX,   # 1st fret (G#)
+            2: FingerAssignment.OPEN,    # open (B)
+            1: FingerAssignment.OPEN,    # open (E)
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Am7 (x-0-2-0-1-0)
+    ChordPattern(
+        name="open_Am7",
+        quality=ChordQuality.MINOR_SEVENTH,
+        frets=(None, 0, 2, 0, 1, 0),  # x-0-2-0-1-0
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.MIDDLE,  # 2nd fret
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Dm7 (x-x-0-2-1-1)
+    ChordPattern(
+        name="open_Dm7",
+        quality=ChordQuality.MINOR_SEVENTH,
+        frets=(None, None, 0, 2, 1, 1),  # x-x-0-2-1-1
+        root_string=4,  # Root D on 4th string, open
+        root_fret=0,
+        finger_assignments={
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.MIDDLE,  # 2nd fret
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.INDEX,   # 1st fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Em7 (0-2-0-0-0-0)
+    ChordPattern(
+        name="open_Em7",
+        quality=ChordQuality.MINOR_SEVENTH,
+        frets=(0, 2, 0, 0, 0, 0),  # 0-2-0-0-0-0
+        root_string=6,  # Root E on 6th string, open
+        root_fret=0,
+        finger_assignments={
+            6: FingerAssignment.OPEN,    # open
+            5: FingerAssignment.MIDDLE,  # 2nd fret
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # B7 (x-2-1-2-0-2)
+    ChordPattern(
+        name="open_B7",
+        quality=ChordQuality.DOMINANT_SEVENTH,
+        frets=(None, 2, 1, 2, 0, 2),  # x-2-1-2-0-2
+        root_string=5,  # Root B on 5th string, 2nd fret
+        root_fret=2,
+        finger_assignments={
+            5: FingerAssignment.MIDDLE,  # 2nd fret
+            4: FingerAssignment.INDEX,   # 1st fret
+            3: FingerAssignment.RING,    # 2nd fret
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.PINKY,   # 2nd fret
+        },
+        pattern_type=PatternType.OPEN
+    )
+)
+
+# Major 7th chord patterns
+_MAJOR_SEVENTH_PATTERNS = (
+    # Amaj7 (x-0-2-1-2-0)
+    ChordPattern(
+        name="open_Amaj7",
+        quality=ChordQuality.MAJOR_SEVENTH,
+        frets=(None, 0, 2, 1, 2, 0),  # x-0-2-1-2-0
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.MIDDLE,  # 2nd fret
+            3: FingerAssignment.INDEX,   # 1st fret
+            2: FingerAssignment.RING,    # 2nd fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Cmaj7 (x-3-2-0-0-0)
+    ChordPattern(
+        name="open_Cmaj7",
+        quality=ChordQuality.MAJOR_SEVENTH,
+        frets=(None, 3, 2, 0, 0, 0),  # x-3-2-0-0-0
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.RING,    # 3rd fret
+            4: FingerAssignment.MIDDLE,  # 2nd fret
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Dmaj7 (x-x-0-2-2-2)
+    ChordPattern(
+        name="open_Dmaj7",
+        quality=ChordQuality.MAJOR_SEVENTH,
+        frets=(None, None, 0, 2, 2, 2),  # x-x-0-2-2-2
+        root_string=4,  # Root D on 4th string, open
+        root_fret=0,
+        finger_assignments={
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.INDEX,   # 2nd fret (use index for all)
+            2: FingerAssignment.MIDDLE,  # 2nd fret
+            1: FingerAssignment.RING,    # 2nd fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Emaj7 (0-2-1-1-0-0)
+    ChordPattern(
+        name="open_Emaj7",
+        quality=ChordQuality.MAJOR_SEVENTH,
+        frets=(0, 2, 1, 1, 0, 0),  # 0-2-1-1-0-0
+        root_string=6,  # Root E on 6th string, open
+        root_fret=0,
+        finger_assignments={
+            6: FingerAssignment.OPEN,    # open
+            5: FingerAssignment.RING,    # 2nd fret
+            4: FingerAssignment.INDEX,   # 1st fret
+            3: FingerAssignment.MIDDLE,  # 1st fret
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Fmaj7 (x-x-3-2-1-0)
+    ChordPattern(
+        name="open_Fmaj7",
+        quality=ChordQuality.MAJOR_SEVENTH,
+        frets=(None, None, 3, 2, 1, 0),  # x-x-3-2-1-0
+        root_string=4,  # Root F on 4th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            4: FingerAssignment.RING,    # 3rd fret
+            3: FingerAssignment.MIDDLE,  # 2nd fret
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Gmaj7 (3-2-0-0-0-2)
+    ChordPattern(
+        name="open_Gmaj7",
+        quality=ChordQuality.MAJOR_SEVENTH,
+        frets=(3, 2, 0, 0, 0, 2),  # 3-2-0-0-0-2
+        root_string=6,  # Root G on 6th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            6: FingerAssignment.RING,    # 3rd fret
+            5: FingerAssignment.MIDDLE,  # 2nd fret
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.INDEX,   # 2nd fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+)
+
+# Suspended chord patterns
+_SUSPENDED_PATTERNS = (
+    # Asus2 (x-0-2-2-0-0)
+    ChordPattern(
+        name="open_Asus2",
+        quality=ChordQuality.SUSPENDED_SECOND,
+        frets=(None, 0, 2, 2, 0, 0),  # x-0-2-2-0-0
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.INDEX,   # 2nd fret
+            3: FingerAssignment.MIDDLE,  # 2nd fret
+            2: FingerAssignment.OPEN,    # open
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Asus4 (x-0-2-2-3-0)
+    ChordPattern(
+        name="open_Asus4",
+        quality=ChordQuality.SUSPENDED_FOURTH,
+        frets=(None, 0, 2, 2, 3, 0),  # x-0-2-2-3-0
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.INDEX,   # 2nd fret
+            3: FingerAssignment.MIDDLE,  # 2nd fret
+            2: FingerAssignment.RING,    # 3rd fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Csus2 (x-3-0-0-1-0)
+    ChordPattern(
+        name="open_Csus2",
+        quality=ChordQuality.SUSPENDED_SECOND,
+        frets=(None, 3, 0, 0, 1, 0),  # x-3-0-0-1-0
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.RING,    # 3rd fret
+            4: FingerAssignment.OPEN,    # open
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Csus4 (x-3-3-0-1-0)
+    ChordPattern(
+        name="open_Csus4",
+        quality=ChordQuality.SUSPENDED_FOURTH,
+        frets=(None, 3, 3, 0, 1, 0),  # x-3-3-0-1-0
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.RING,    # 3rd fret
+            4: FingerAssignment.PINKY,   # 3rd fret
+            3: FingerAssignment.OPEN,    # open
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+)
+
+# Diminished chord patterns
+_DIMINISHED_PATTERNS = (
+    # Adim (x-0-1-2-1-x)
+    ChordPattern(
+        name="open_Adim",
+        quality=ChordQuality.DIMINISHED,
+        frets=(None, 0, 1, 2, 1, None),  # x-0-1-2-1-x
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.INDEX,   # 1st fret
+            3: FingerAssignment.RING,    # 2nd fret
+            2: FingerAssignment.MIDDLE,  # 1st fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Bdim (x-2-3-1-3-x)
+    ChordPattern(
+        name="open_Bdim",
+        quality=ChordQuality.DIMINISHED,
+        frets=(None, 2, 3, 1, 3, None),  # x-2-3-1-3-x
+        root_string=5,  # Root B on 5th string, 2nd fret
+        root_fret=2,
+        finger_assignments={
+            5: FingerAssignment.MIDDLE,  # 2nd fret
+            4: FingerAssignment.RING,    # 3rd fret
+            3: FingerAssignment.INDEX,   # 1st fret
+            2: FingerAssignment.PINKY,   # 3rd fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+)
+
+# Augmented chord patterns
+_AUGMENTED_PATTERNS = (
+    # Aaug (x-0-3-2-2-1)
+    ChordPattern(
+        name="open_Aaug",
+        quality=ChordQuality.AUGMENTED,
+        frets=(None, 0, 3, 2, 2, 1),  # x-0-3-2-2-1
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.PINKY,   # 3rd fret
+            3: FingerAssignment.RING,    # 2nd fret
+            2: FingerAssignment.MIDDLE,  # 2nd fret
+            1: FingerAssignment.INDEX,   # 1st fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # Caug (x-3-2-1-1-0)
+    ChordPattern(
+        name="open_Caug",
+        quality=ChordQuality.AUGMENTED,
+        frets=(None, 3, 2, 1, 1, 0),  # x-3-2-1-1-0
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.PINKY,   # 3rd fret
+            4: FingerAssignment.RING,    # 2nd fret
+            3: FingerAssignment.INDEX,   # 1st fret
+            2: FingerAssignment.MIDDLE,  # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+)
+
+# 6th chord patterns
+_SIXTH_PATTERNS = (
+    # A6 (x-0-2-2-2-2)
+    ChordPattern(
+        name="open_A6",
+        quality=ChordQuality.SIXTH,
+        frets=(None, 0, 2, 2, 2, 2),  # x-0-2-2-2-2
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.INDEX,   # 2nd fret (barre-like)
+            3: FingerAssignment.MIDDLE,  # 2nd fret
+            2: FingerAssignment.RING,    # 2nd fret
+            1: FingerAssignment.PINKY,   # 2nd fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # C6 (x-3-2-2-1-0)
+    ChordPattern(
+        name="open_C6",
+        quality=ChordQuality.SIXTH,
+        frets=(None, 3, 2, 2, 1, 0),  # x-3-2-2-1-0
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.PINKY,   # 3rd fret
+            4: FingerAssignment.MIDDLE,  # 2nd fret
+            3: FingerAssignment.RING,    # 2nd fret
+            2: FingerAssignment.INDEX,   # 1st fret
+            1: FingerAssignment.OPEN,    # open
+        },
+        pattern_type=PatternType.OPEN
+    ),
+)
+
+# 9th chord patterns
+_NINTH_PATTERNS = (
+    # A9 (x-0-2-4-2-3)
+    ChordPattern(
+        name="open_A9",
+        quality=ChordQuality.NINTH,
+        frets=(None, 0, 2, 4, 2, 3),  # x-0-2-4-2-3
+        root_string=5,  # Root A on 5th string, open
+        root_fret=0,
+        finger_assignments={
+            5: FingerAssignment.OPEN,    # open
+            4: FingerAssignment.INDEX,   # 2nd fret
+            3: FingerAssignment.PINKY,   # 4th fret
+            2: FingerAssignment.MIDDLE,  # 2nd fret
+            1: FingerAssignment.RING,    # 3rd fret
+        },
+        pattern_type=PatternType.OPEN
+    ),
+    
+    # C9 (x-3-2-3-3-3)
+    ChordPattern(
+        name="open_C9",
+        quality=ChordQuality.NINTH,
+        frets=(None, 3, 2, 3, 3, 3),  # x-3-2-3-3-3
+        root_string=5,  # Root C on 5th string, 3rd fret
+        root_fret=3,
+        finger_assignments={
+            5: FingerAssignment.MIDDLE,  # 3rd fret (barre-like)
+            4: FingerAssignment.INDEX,   # 2nd fret
+            3: FingerAssignment.RING,    # 3rd fret
+            2: FingerAssignment.PINKY,   # 3rd fret
+            1: FingerAssignment.PINKY,   # 3rd fret (same finger)
+        },
+        pattern_type=PatternType.OPEN
+    ),
+)
+
+# Patterns by the chord quality they voice, built once at import
+_PATTERNS_BY_QUALITY: Dict[ChordQuality, Tuple[ChordPattern, ...]] = {
+    ChordQuality.MAJOR: _OPEN_MAJOR_PATTERNS,
+    ChordQuality.MINOR: _OPEN_MINOR_PATTERNS,
+    
+    # Separate seventh patterns by their actual quality
+    ChordQuality.DOMINANT_SEVENTH: tuple(p for p in _SEVENTH_PATTERNS if p.quality == ChordQuality.DOMINANT_SEVENTH),
+    ChordQuality.MINOR_SEVENTH: tuple(p for p in _SEVENTH_PATTERNS if p.quality == ChordQuality.MINOR_SEVENTH),
+    
+    ChordQuality.MAJOR_SEVENTH: _MAJOR_SEVENTH_PATTERNS,
+    ChordQuality.SUSPENDED_SECOND: tuple(p for p in _SUSPENDED_PATTERNS if p.quality == ChordQuality.SUSPENDED_SECOND),
+    ChordQuality.SUSPENDED_FOURTH: tuple(p for p in _SUSPENDED_PATTERNS if p.quality == ChordQuality.SUSPENDED_FOURTH),
+    ChordQuality.DIMINISHED: _DIMINISHED_PATTERNS,
+    ChordQuality.AUGMENTED: _AUGMENTED_PATTERNS,
+    ChordQuality.SIXTH: _SIXTH_PATTERNS,
+    ChordQuality.NINTH: _NINTH_PATTERNS,
+}
+
+
+def _build_offset_index(patterns_by_quality: Dict[ChordQuality, Tuple[ChordPattern, ...]]
+                        ) -> Dict[ChordQuality, Tuple[Tuple[Tuple[ChordPattern, int], ...], ...]]:
+    """
+    Index patterns by quality, then by root pitch class (a 12-slot tuple).
+    
+    Each entry is a (pattern, semitones) pair: open patterns are listed
+    under their own root, barre patterns under every root they can be
+    transposed to. Entries are pre-sorted by lowest fret so lookups only
+    have to materialize them.
+    """
+    index: Dict[ChordQuality, Tuple[Tuple[Tuple[ChordPattern, int], ...], ...]] = {}
+    
+    for quality, patterns in patterns_by_quality.items():
+        candidates = []
+        for pattern in patterns:
+            sounding = [f for f in pattern.frets if f is not None]
+            min_fret = min(sounding) if sounding else 999
+            
+            # The pattern as written
+            candidates.append((min_fret, pattern.root_pc, pattern, 0))
+            
+            # Barre patterns can also be transposed up to other roots
+            if pattern.pattern_type in (PatternType.BARRE_E, PatternType.BARRE_A):
+                max_fret = max(sounding)
+                for semitones in range(1, 12):
+                    if max_fret + semitones > 12:  # Don't transpose beyond 12th fret
+                        break
+                    candidates.append((min_fret + semitones, (pattern.root_pc + semitones) % 12,
+                                       pattern, semitones))
+        
+        # Sort by lowest fret position to prefer easier positions (stable,
+        # so ties keep database order)
+        candidates.sort(key=lambda candidate: candidate[0])
+        by_root: List[List[Tuple[ChordPattern, int]]] = [[] for _ in range(12)]
+        for _, root_pc, pattern, semitones in candidates:
+            by_root[root_pc].append((pattern, semitones))
+        index[quality] = tuple(tuple(entries) for entries in by_root)
+    
+    return index
+
+
+# (pattern, semitones) candidates as _PATTERN_OFFSETS[quality][root pitch class],
+# built once at import. Nesting avoids hashing a (quality, pc) tuple per lookup,
+# which costs a Python-level Enum.__hash__ call plus the tuple itself.
+_PATTERN_OFFSETS = _build_offset_index(_PATTERNS_BY_QUALITY)
+
+# Transposed barre patterns by (pattern name, semitones, root spelling), shared
+# by every database instance since the patterns they come from are shared too
+_TRANSPOSED: Dict[Tuple[str, int, str], ChordPattern] = {}
+
+# String numbers in the order pattern frets are listed (string 6 first)
+_STRING_NUMBERS = (6, 5, 4, 3, 2, 1)
+
+# Every note on a standard-tuned fretboard, indexed as _NOTE_GRID[string - 1][fret]
+_FRETBOARD = Fretboard(STANDARD_TUNING)
+_NOTE_GRID = tuple(
+    tuple(_FRETBOARD.get_note_at_position(string, fret)
+          for fret in range(_FRETBOARD.num_frets + 1))
+    for string in range(1, 7)
+)
 
 
 class ChordPatternDatabase:
@@ -51,729 +873,18 @@ class ChordPatternDatabase:
     
     def __init__(self):
         """Initialize with common chord patterns"""
-        self.patterns: Dict[ChordQuality, List[ChordPattern]] = {}
+        self.patterns: Dict[ChordQuality, Tuple[ChordPattern, ...]] = {}
         self._build_pattern_database()
     
     def _build_pattern_database(self):
-        """Build the database of common chord patterns"""
-        
-        # Open position major chords
-        open_major_patterns = [
-            # C major (x-3-2-0-1-0)
-            ChordPattern(
-                name="open_C_major",
-                quality=ChordQuality.MAJOR,
-                frets=[None, 3, 2, 0, 1, 0],  # x-3-2-0-1-0
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.RING,    # 3rd fret
-                    4: FingerAssignment.MIDDLE,  # 2nd fret
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # G major (3-2-0-0-3-3)
-            ChordPattern(
-                name="open_G_major",
-                quality=ChordQuality.MAJOR,
-                frets=[3, 2, 0, 0, 3, 3],  # 3-2-0-0-3-3
-                root_string=6,  # Root G on 6th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    6: FingerAssignment.MIDDLE,  # 3rd fret
-                    5: FingerAssignment.INDEX,   # 2nd fret
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.RING,    # 3rd fret
-                    1: FingerAssignment.PINKY,   # 3rd fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # D major (x-x-0-2-3-2)
-            ChordPattern(
-                name="open_D_major",
-                quality=ChordQuality.MAJOR,
-                frets=[None, None, 0, 2, 3, 2],  # x-x-0-2-3-2
-                root_string=4,  # Root D on 4th string, open
-                root_fret=0,
-                finger_assignments={
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.INDEX,   # 2nd fret
-                    2: FingerAssignment.RING,    # 3rd fret
-                    1: FingerAssignment.MIDDLE,  # 2nd fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # A major (x-0-2-2-2-0)
-            ChordPattern(
-                name="open_A_major",
-                quality=ChordQuality.MAJOR,
-                frets=[None, 0, 2, 2, 2, 0],  # x-0-2-2-2-0
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.INDEX,   # 2nd fret
-                    3: FingerAssignment.MIDDLE,  # 2nd fret
-                    2: FingerAssignment.RING,    # 2nd fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # E major (0-2-2-1-0-0)
-            ChordPattern(
-                name="open_E_major",
-                quality=ChordQuality.MAJOR,
-                frets=[0, 2, 2, 1, 0, 0],  # 0-2-2-1-0-0
-                root_string=6,  # Root E on 6th string, open
-                root_fret=0,
-                finger_assignments={
-                    6: FingerAssignment.OPEN,    # open
-                    5: FingerAssignment.MIDDLE,  # 2nd fret
-                    4: FingerAssignment.RING,    # 2nd fret
-                    3: FingerAssignment.INDEX,   # 1st fret
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # F major (1-3-3-2-1-1) - E-shape barre chord
-            ChordPattern(
-                name="F_major_E_barre",
-                quality=ChordQuality.MAJOR,
-                frets=[1, 3, 3, 2, 1, 1],  # 1-3-3-2-1-1
-                root_string=6,  # Root F on 6th string, 1st fret
-                root_fret=1,
-                finger_assignments={
-                    6: FingerAssignment.INDEX,   # 1st fret (barre)
-                    5: FingerAssignment.RING,    # 3rd fret
-                    4: FingerAssignment.PINKY,   # 3rd fret
-                    3: FingerAssignment.MIDDLE,  # 2nd fret
-                    2: FingerAssignment.INDEX,   # 1st fret (barre)
-                    1: FingerAssignment.INDEX,   # 1st fret (barre)
-                },
-                pattern_type=PatternType.BARRE_E,
-                difficulty=0.5  # F barre is harder
-            ),
-            
-            # Bb major (x-1-3-3-3-1) - A-shape barre chord
-            ChordPattern(
-                name="Bb_major_A_barre",
-                quality=ChordQuality.MAJOR,
-                frets=[None, 1, 3, 3, 3, 1],  # x-1-3-3-3-1
-                root_string=5,  # Root Bb on 5th string, 1st fret
-                root_fret=1,
-                finger_assignments={
-                    5: FingerAssignment.INDEX,   # 1st fret (barre)
-                    4: FingerAssignment.MIDDLE,  # 3rd fret
-                    3: FingerAssignment.RING,    # 3rd fret
-                    2: FingerAssignment.PINKY,   # 3rd fret
-                    1: FingerAssignment.INDEX,   # 1st fret (barre)
-                },
-                pattern_type=PatternType.BARRE_A,
-                difficulty=0.4  # A-shape barre
-            )
-        ]
-        
-        # Open position minor chords
-        open_minor_patterns = [
-            # A minor (x-0-2-2-1-0)
-            ChordPattern(
-                name="open_Am_minor",
-                quality=ChordQuality.MINOR,
-                frets=[None, 0, 2, 2, 1, 0],  # x-0-2-2-1-0
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.MIDDLE,  # 2nd fret
-                    3: FingerAssignment.RING,    # 2nd fret
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # E minor (0-2-2-0-0-0)
-            ChordPattern(
-                name="open_Em_minor",
-                quality=ChordQuality.MINOR,
-                frets=[0, 2, 2, 0, 0, 0],  # 0-2-2-0-0-0
-                root_string=6,  # Root E on 6th string, open
-                root_fret=0,
-                finger_assignments={
-                    6: FingerAssignment.OPEN,    # open
-                    5: FingerAssignment.MIDDLE,  # 2nd fret
-                    4: FingerAssignment.RING,    # 2nd fret
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Bbm (x-1-3-3-2-1) - A-shape minor barre chord
-            ChordPattern(
-                name="Bbm_minor_A_barre",
-                quality=ChordQuality.MINOR,
-                frets=[None, 1, 3, 3, 2, 1],  # x-1-3-3-2-1
-                root_string=5,  # Root Bb on 5th string, 1st fret
-                root_fret=1,
-                finger_assignments={
-                    5: FingerAssignment.INDEX,   # 1st fret (barre)
-                    4: FingerAssignment.RING,    # 3rd fret
-                    3: FingerAssignment.PINKY,   # 3rd fret
-                    2: FingerAssignment.MIDDLE,  # 2nd fret
-                    1: FingerAssignment.INDEX,   # 1st fret (barre)
-                },
-                pattern_type=PatternType.BARRE_A,
-                difficulty=0.4  # A-shape minor barre
-            ),
-            
-            # Fm (1-3-3-1-1-1) - E-shape minor barre chord
-            ChordPattern(
-                name="Fm_minor_E_barre",
-                quality=ChordQuality.MINOR,
-                frets=[1, 3, 3, 1, 1, 1],  # 1-3-3-1-1-1
-                root_string=6,  # Root F on 6th string, 1st fret
-                root_fret=1,
-                finger_assignments={
-                    6: FingerAssignment.INDEX,   # 1st fret (barre)
-                    5: FingerAssignment.RING,    # 3rd fret
-                    4: FingerAssignment.PINKY,   # 3rd fret
-                    3: FingerAssignment.INDEX,   # 1st fret (barre)
-                    2: FingerAssignment.INDEX,   # 1st fret (barre)
-                    1: FingerAssignment.INDEX,   # 1st fret (barre)
-                },
-                pattern_type=PatternType.BARRE_E,
-                difficulty=0.5  # E-shape minor barre
-            ),
-            
-            # D minor (x-x-0-2-3-1)
-            ChordPattern(
-                name="open_Dm_minor",
-                quality=ChordQuality.MINOR,
-                frets=[None, None, 0, 2, 3, 1],  # x-x-0-2-3-1
-                root_string=4,  # Root D on 4th string, open
-                root_fret=0,
-                finger_assignments={
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.INDEX,   # 2nd fret
-                    2: FingerAssignment.RING,    # 3rd fret
-                    1: FingerAssignment.MIDDLE,  # 1st fret
-                },
-                pattern_type=PatternType.OPEN
-            )
-        ]
-        
-        # Seventh chord patterns
-        seventh_patterns = [
-            # G7 (3-2-0-0-0-1)
-            ChordPattern(
-                name="open_G7",
-                quality=ChordQuality.DOMINANT_SEVENTH,
-                frets=[3, 2, 0, 0, 0, 1],  # 3-2-0-0-0-1
-                root_string=6,  # Root G on 6th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    6: FingerAssignment.MIDDLE,  # 3rd fret
-                    5: FingerAssignment.INDEX,   # 2nd fret
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.RING,    # 1st fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # C7 (x-3-2-3-1-0) - standard open C7 without 5th
-            ChordPattern(
-                name="open_C7",
-                quality=ChordQuality.DOMINANT_SEVENTH,
-                frets=[None, 3, 2, 3, 1, 0],  # x-3-2-3-1-0
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.RING,    # 3rd fret (C)
-                    4: FingerAssignment.INDEX,   # 2nd fret (E)
-                    3: FingerAssignment.PINKY,   # 3rd fret (Bb)
-                    2: FingerAssignment.MIDDLE,  # 1st fret (C)
-                    1: FingerAssignment.OPEN,    # open (E)
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # D7 (x-x-0-2-1-2)
-            ChordPattern(
-                name="open_D7",
-                quality=ChordQuality.DOMINANT_SEVENTH,
-                frets=[None, None, 0, 2, 1, 2],  # x-x-0-2-1-2
-                root_string=4,  # Root D on 4th string, open
-                root_fret=0,
-                finger_assignments={
-                    4: FingerAssignment.OPEN,    # open (D)
-                    3: FingerAssignment.MIDDLE,  # 2nd fret (A)
-                    2: FingerAssignment.INDEX,   # 1st fret (C)
-                    1: FingerAssignment.RING,    # 2nd fret (F#)
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # A7 (x-0-2-0-2-0)
-            ChordPattern(
-                name="open_A7",
-                quality=ChordQuality.DOMINANT_SEVENTH,
-                frets=[None, 0, 2, 0, 2, 0],  # x-0-2-0-2-0
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open (A)
-                    4: FingerAssignment.MIDDLE,  # 2nd fret (E)
-                    3: FingerAssignment.OPEN,    # open (G)
-                    2: FingerAssignment.RING,    # 2nd fret (C#)
-                    1: FingerAssignment.OPEN,    # open (E)
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # E7 (0-2-0-1-0-0)
-            ChordPattern(
-                name="open_E7",
-                quality=ChordQuality.DOMINANT_SEVENTH,
-                frets=[0, 2, 0, 1, 0, 0],  # 0-2-0-1-0-0
-                root_string=6,  # Root E on 6th string, open
-                root_fret=0,
-                finger_assignments={
-                    6: FingerAssignment.OPEN,    # open (E)
-                    5: FingerAssignment.MIDDLE,  # 2nd fret (B)
-                    4: FingerAssignment.OPEN,    # open (D)
-                    3: FingerAssignment.INDEX,   # 1st fret (G#)
-                    2: FingerAssignment.OPEN,    # open (B)
-                    1: FingerAssignment.OPEN,    # open (E)
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Am7 (x-0-2-0-1-0)
-            ChordPattern(
-                name="open_Am7",
-                quality=ChordQuality.MINOR_SEVENTH,
-                frets=[None, 0, 2, 0, 1, 0],  # x-0-2-0-1-0
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.MIDDLE,  # 2nd fret
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Dm7 (x-x-0-2-1-1)
-            ChordPattern(
-                name="open_Dm7",
-                quality=ChordQuality.MINOR_SEVENTH,
-                frets=[None, None, 0, 2, 1, 1],  # x-x-0-2-1-1
-                root_string=4,  # Root D on 4th string, open
-                root_fret=0,
-                finger_assignments={
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.MIDDLE,  # 2nd fret
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.INDEX,   # 1st fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Em7 (0-2-0-0-0-0)
-            ChordPattern(
-                name="open_Em7",
-                quality=ChordQuality.MINOR_SEVENTH,
-                frets=[0, 2, 0, 0, 0, 0],  # 0-2-0-0-0-0
-                root_string=6,  # Root E on 6th string, open
-                root_fret=0,
-                finger_assignments={
-                    6: FingerAssignment.OPEN,    # open
-                    5: FingerAssignment.MIDDLE,  # 2nd fret
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # B7 (x-2-1-2-0-2)
-            ChordPattern(
-                name="open_B7",
-                quality=ChordQuality.DOMINANT_SEVENTH,
-                frets=[None, 2, 1, 2, 0, 2],  # x-2-1-2-0-2
-                root_string=5,  # Root B on 5th string, 2nd fret
-                root_fret=2,
-                finger_assignments={
-                    5: FingerAssignment.MIDDLE,  # 2nd fret
-                    4: FingerAssignment.INDEX,   # 1st fret
-                    3: FingerAssignment.RING,    # 2nd fret
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.PINKY,   # 2nd fret
-                },
-                pattern_type=PatternType.OPEN
-            )
-        ]
-        
-        # Major 7th chord patterns
-        major_seventh_patterns = [
-            # Amaj7 (x-0-2-1-2-0)
-            ChordPattern(
-                name="open_Amaj7",
-                quality=ChordQuality.MAJOR_SEVENTH,
-                frets=[None, 0, 2, 1, 2, 0],  # x-0-2-1-2-0
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.MIDDLE,  # 2nd fret
-                    3: FingerAssignment.INDEX,   # 1st fret
-                    2: FingerAssignment.RING,    # 2nd fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Cmaj7 (x-3-2-0-0-0)
-            ChordPattern(
-                name="open_Cmaj7",
-                quality=ChordQuality.MAJOR_SEVENTH,
-                frets=[None, 3, 2, 0, 0, 0],  # x-3-2-0-0-0
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.RING,    # 3rd fret
-                    4: FingerAssignment.MIDDLE,  # 2nd fret
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Dmaj7 (x-x-0-2-2-2)
-            ChordPattern(
-                name="open_Dmaj7",
-                quality=ChordQuality.MAJOR_SEVENTH,
-                frets=[None, None, 0, 2, 2, 2],  # x-x-0-2-2-2
-                root_string=4,  # Root D on 4th string, open
-                root_fret=0,
-                finger_assignments={
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.INDEX,   # 2nd fret (use index for all)
-                    2: FingerAssignment.MIDDLE,  # 2nd fret
-                    1: FingerAssignment.RING,    # 2nd fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Emaj7 (0-2-1-1-0-0)
-            ChordPattern(
-                name="open_Emaj7",
-                quality=ChordQuality.MAJOR_SEVENTH,
-                frets=[0, 2, 1, 1, 0, 0],  # 0-2-1-1-0-0
-                root_string=6,  # Root E on 6th string, open
-                root_fret=0,
-                finger_assignments={
-                    6: FingerAssignment.OPEN,    # open
-                    5: FingerAssignment.RING,    # 2nd fret
-                    4: FingerAssignment.INDEX,   # 1st fret
-                    3: FingerAssignment.MIDDLE,  # 1st fret
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Fmaj7 (x-x-3-2-1-0)
-            ChordPattern(
-                name="open_Fmaj7",
-                quality=ChordQuality.MAJOR_SEVENTH,
-                frets=[None, None, 3, 2, 1, 0],  # x-x-3-2-1-0
-                root_string=4,  # Root F on 4th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    4: FingerAssignment.RING,    # 3rd fret
-                    3: FingerAssignment.MIDDLE,  # 2nd fret
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Gmaj7 (3-2-0-0-0-2)
-            ChordPattern(
-                name="open_Gmaj7",
-                quality=ChordQuality.MAJOR_SEVENTH,
-                frets=[3, 2, 0, 0, 0, 2],  # 3-2-0-0-0-2
-                root_string=6,  # Root G on 6th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    6: FingerAssignment.RING,    # 3rd fret
-                    5: FingerAssignment.MIDDLE,  # 2nd fret
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.INDEX,   # 2nd fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-        ]
-        
-        # Suspended chord patterns
-        suspended_patterns = [
-            # Asus2 (x-0-2-2-0-0)
-            ChordPattern(
-                name="open_Asus2",
-                quality=ChordQuality.SUSPENDED_SECOND,
-                frets=[None, 0, 2, 2, 0, 0],  # x-0-2-2-0-0
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.INDEX,   # 2nd fret
-                    3: FingerAssignment.MIDDLE,  # 2nd fret
-                    2: FingerAssignment.OPEN,    # open
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Asus4 (x-0-2-2-3-0)
-            ChordPattern(
-                name="open_Asus4",
-                quality=ChordQuality.SUSPENDED_FOURTH,
-                frets=[None, 0, 2, 2, 3, 0],  # x-0-2-2-3-0
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.INDEX,   # 2nd fret
-                    3: FingerAssignment.MIDDLE,  # 2nd fret
-                    2: FingerAssignment.RING,    # 3rd fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Csus2 (x-3-0-0-1-0)
-            ChordPattern(
-                name="open_Csus2",
-                quality=ChordQuality.SUSPENDED_SECOND,
-                frets=[None, 3, 0, 0, 1, 0],  # x-3-0-0-1-0
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.RING,    # 3rd fret
-                    4: FingerAssignment.OPEN,    # open
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Csus4 (x-3-3-0-1-0)
-            ChordPattern(
-                name="open_Csus4",
-                quality=ChordQuality.SUSPENDED_FOURTH,
-                frets=[None, 3, 3, 0, 1, 0],  # x-3-3-0-1-0
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.RING,    # 3rd fret
-                    4: FingerAssignment.PINKY,   # 3rd fret
-                    3: FingerAssignment.OPEN,    # open
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-        ]
-        
-        # Diminished chord patterns
-        diminished_patterns = [
-            # Adim (x-0-1-2-1-x)
-            ChordPattern(
-                name="open_Adim",
-                quality=ChordQuality.DIMINISHED,
-                frets=[None, 0, 1, 2, 1, None],  # x-0-1-2-1-x
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.INDEX,   # 1st fret
-                    3: FingerAssignment.RING,    # 2nd fret
-                    2: FingerAssignment.MIDDLE,  # 1st fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Bdim (x-2-3-1-3-x)
-            ChordPattern(
-                name="open_Bdim",
-                quality=ChordQuality.DIMINISHED,
-                frets=[None, 2, 3, 1, 3, None],  # x-2-3-1-3-x
-                root_string=5,  # Root B on 5th string, 2nd fret
-                root_fret=2,
-                finger_assignments={
-                    5: FingerAssignment.MIDDLE,  # 2nd fret
-                    4: FingerAssignment.RING,    # 3rd fret
-                    3: FingerAssignment.INDEX,   # 1st fret
-                    2: FingerAssignment.PINKY,   # 3rd fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-        ]
-        
-        # Augmented chord patterns
-        augmented_patterns = [
-            # Aaug (x-0-3-2-2-1)
-            ChordPattern(
-                name="open_Aaug",
-                quality=ChordQuality.AUGMENTED,
-                frets=[None, 0, 3, 2, 2, 1],  # x-0-3-2-2-1
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.PINKY,   # 3rd fret
-                    3: FingerAssignment.RING,    # 2nd fret
-                    2: FingerAssignment.MIDDLE,  # 2nd fret
-                    1: FingerAssignment.INDEX,   # 1st fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # Caug (x-3-2-1-1-0)
-            ChordPattern(
-                name="open_Caug",
-                quality=ChordQuality.AUGMENTED,
-                frets=[None, 3, 2, 1, 1, 0],  # x-3-2-1-1-0
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.PINKY,   # 3rd fret
-                    4: FingerAssignment.RING,    # 2nd fret
-                    3: FingerAssignment.INDEX,   # 1st fret
-                    2: FingerAssignment.MIDDLE,  # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-        ]
-        
-        # 6th chord patterns
-        sixth_patterns = [
-            # A6 (x-0-2-2-2-2)
-            ChordPattern(
-                name="open_A6",
-                quality=ChordQuality.SIXTH,
-                frets=[None, 0, 2, 2, 2, 2],  # x-0-2-2-2-2
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.INDEX,   # 2nd fret (barre-like)
-                    3: FingerAssignment.MIDDLE,  # 2nd fret
-                    2: FingerAssignment.RING,    # 2nd fret
-                    1: FingerAssignment.PINKY,   # 2nd fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # C6 (x-3-2-2-1-0)
-            ChordPattern(
-                name="open_C6",
-                quality=ChordQuality.SIXTH,
-                frets=[None, 3, 2, 2, 1, 0],  # x-3-2-2-1-0
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.PINKY,   # 3rd fret
-                    4: FingerAssignment.MIDDLE,  # 2nd fret
-                    3: FingerAssignment.RING,    # 2nd fret
-                    2: FingerAssignment.INDEX,   # 1st fret
-                    1: FingerAssignment.OPEN,    # open
-                },
-                pattern_type=PatternType.OPEN
-            ),
-        ]
-        
-        # 9th chord patterns
-        ninth_patterns = [
-            # A9 (x-0-2-4-2-3)
-            ChordPattern(
-                name="open_A9",
-                quality=ChordQuality.NINTH,
-                frets=[None, 0, 2, 4, 2, 3],  # x-0-2-4-2-3
-                root_string=5,  # Root A on 5th string, open
-                root_fret=0,
-                finger_assignments={
-                    5: FingerAssignment.OPEN,    # open
-                    4: FingerAssignment.INDEX,   # 2nd fret
-                    3: FingerAssignment.PINKY,   # 4th fret
-                    2: FingerAssignment.MIDDLE,  # 2nd fret
-                    1: FingerAssignment.RING,    # 3rd fret
-                },
-                pattern_type=PatternType.OPEN
-            ),
-            
-            # C9 (x-3-2-3-3-3)
-            ChordPattern(
-                name="open_C9",
-                quality=ChordQuality.NINTH,
-                frets=[None, 3, 2, 3, 3, 3],  # x-3-2-3-3-3
-                root_string=5,  # Root C on 5th string, 3rd fret
-                root_fret=3,
-                finger_assignments={
-                    5: FingerAssignment.MIDDLE,  # 3rd fret (barre-like)
-                    4: FingerAssignment.INDEX,   # 2nd fret
-                    3: FingerAssignment.RING,    # 3rd fret
-                    2: FingerAssignment.PINKY,   # 3rd fret
-                    1: FingerAssignment.PINKY,   # 3rd fret (same finger)
-                },
-                pattern_type=PatternType.OPEN
-            ),
-        ]
-        
-        # Store patterns by quality - separate by actual chord quality
-        self.patterns[ChordQuality.MAJOR] = open_major_patterns
-        self.patterns[ChordQuality.MINOR] = open_minor_patterns
-        
-        # Separate seventh patterns by their actual quality
-        self.patterns[ChordQuality.DOMINANT_SEVENTH] = [p for p in seventh_patterns if p.quality == ChordQuality.DOMINANT_SEVENTH]
-        self.patterns[ChordQuality.MINOR_SEVENTH] = [p for p in seventh_patterns if p.quality == ChordQuality.MINOR_SEVENTH]
-        
-        self.patterns[ChordQuality.MAJOR_SEVENTH] = major_seventh_patterns
-        self.patterns[ChordQuality.SUSPENDED_SECOND] = [p for p in suspended_patterns if p.quality == ChordQuality.SUSPENDED_SECOND]
-        self.patterns[ChordQuality.SUSPENDED_FOURTH] = [p for p in suspended_patterns if p.quality == ChordQuality.SUSPENDED_FOURTH]
-        self.patterns[ChordQuality.DIMINISHED] = diminished_patterns
-        self.patterns[ChordQuality.AUGMENTED] = augmented_patterns
-        self.patterns[ChordQuality.SIXTH] = sixth_patterns
-        self.patterns[ChordQuality.NINTH] = ninth_patterns
-    
-    def get_patterns_for_quality(self, quality: ChordQuality) -> List[ChordPattern]:
+        """Load the shared pattern table (immutable, so it is not copied)"""
+        self.patterns.update(_PATTERNS_BY_QUALITY)
+    
+    def get_patterns_for_quality(self, quality: ChordQuality) -> Tuple[ChordPattern, ...]:
         """Get all patterns for a given chord quality"""
-        return self.patterns.get(quality, [])
+        return self.patterns.get(quality, ())
     
-    def find_matching_patterns(self, root_note: Note, quality: ChordQuality) -> List[ChordPattern]:
+    def find_matching_patterns(self, root_note: Note, quality: ChordQuality) -> Tuple[ChordPattern, ...]:
         """
         Find patterns that match a specific chord root and quality.
         
@@ -782,36 +893,53 @@ class ChordPatternDatabase:
             quality: Chord quality
             
         Returns:
-            List of matching patterns (may be empty if no matches)
+            Tuple of matching patterns (may be empty if no matches)
         """
-        patterns = self.get_patterns_for_quality(quality)
-        matching = []
-        
-        fretboard = Fretboard(STANDARD_TUNING)
+        return tuple(pattern if semitones == 0 else self._cached_transposition(pattern, semitones, root_note)
+                     for pattern, semitones in self.find_pattern_offsets(root_note, quality))
+    
+    def find_many(self, chords: Sequence[Tuple[Note, ChordQuality]]) -> List[Tuple[ChordPattern, ...]]:
+        """
+        Find matching patterns for a sequence of chords, looking each distinct chord up once.
         
-        for pattern in patterns:
-            # Get the root note at the pattern's root position
-            pattern_root = fretboard.get_note_at_position(pattern.root_string, pattern.root_fret)
+        Args:
+            chords: (root_note, quality) pairs, e.g. the chords of a song
             
-            # Check if this pattern's root matches our target root (by pitch class)
-            if pattern_root.pitch_class == root_note.pitch_class:
-                matching.append(pattern)
-            # For barre chords, also check if we can transpose the pattern
-            elif pattern.pattern_type in [PatternType.BARRE_E, PatternType.BARRE_A]:
-                # Calculate semitone distance between pattern root and target root
-                semitone_diff = (root_note.pitch_class - pattern_root.pitch_class) % 12
-                
-                # Create transposed pattern if it's reasonable (not too high on fretboard)
-                max_fret = max(f for f in pattern.frets if f is not None)
-                if max_fret + semitone_diff <= 12:  # Don't transpose beyond 12th fret
-                    transposed = self._transpose_pattern(pattern, semitone_diff, root_note)
-                    if transposed:
-                        matching.append(transposed)
+        Returns:
+            Matching patterns for each chord, in input order
+        """
+        matches = {chord: self.find_matching_patterns(*chord) for chord in dict.fromkeys(chords)}
+        return [matches[chord] for chord in chords]
+    
+    def find_pattern_offsets(self, root_note: Note, quality: ChordQuality) -> Tuple[Tuple[ChordPattern, int], ...]:
+        """
+        Find untransposed patterns that can play a chord, with the shift each needs.
         
-        # Sort by lowest fret position to prefer easier positions
-        matching.sort(key=lambda p: min(f for f in p.frets if f is not None) if any(f is not None for f in p.frets) else 999)
+        Args:
+            root_note: Root note of the chord
+            quality: Chord quality
+            
+        Returns:
+            Tuple of (pattern, semitones) pairs, easiest position first;
+            semitones is 0 for patterns that already have the right root
+        """
+        by_root = _PATTERN_OFFSETS.get(quality)
+        return by_root[root_note.pitch_class] if by_root is not None else ()
+    
+    def _cached_transposition(self, pattern: ChordPattern, semitones: int, target_root: Note) -> Optional[ChordPattern]:
+        """
+        Transpose a pattern, reusing the result of earlier identical requests.
         
-        return matching
+        Patterns are immutable, so a transposed pattern (and the fret
+        positions it caches) can be shared by every caller. The root's
+        spelling is part of the key because it appears in the pattern name.
+        """
+        key = (pattern.name, semitones, target_root.name)
+        transposed = _TRANSPOSED.get(key)
+        if transposed is None:
+            transposed = self._transpose_pattern(pattern, semitones, target_root)
+            _TRANSPOSED[key] = transposed
+        return transposed
     
     def _transpose_pattern(self, pattern: ChordPattern, semitones: int, target_root: Note) -> Optional[ChordPattern]:
         """
@@ -843,11 +971,6 @@ class ChordPatternDatabase:
             # Create new pattern name
             new_name = f"{pattern.name}_transposed_to_{target_root.name}"
             
-            # Transpose finger assignments
-            transposed_assignments = {}
-            for string, finger in pattern.finger_assignments.items():
-                transposed_assignments[string] = finger
-            
             # Create transposed pattern
             return ChordPattern(
                 name=new_name,
@@ -855,13 +978,24 @@ class ChordPatternDatabase:
                 frets=transposed_frets,
                 root_string=pattern.root_string,
                 root_fret=pattern.root_fret + semitones,
-                finger_assignments=transposed_assignments,
+                finger_assignments=pattern.finger_assignments,  # Same fingers, higher up
                 pattern_type=pattern.pattern_type,
                 difficulty=pattern.difficulty
             )
         except Exception:
             return None
     
+    def _pattern_positions(self, pattern: ChordPattern) -> Tuple[FretPosition, ...]:
+        """Convert a pattern's fret list to fret positions"""
+        positions = []
+        
+        for string, fret in zip(_STRING_NUMBERS, pattern.frets):
+            if fret is not None:  # Not muted
+                note = _NOTE_GRID[string - 1][fret]
+                positions.append(FretPosition(string=string, fret=fret, note=note))
+        
+        return tuple(positions)
+    
     def pattern_to_fingering(self, pattern: ChordPattern, chord) -> Fingering:
         """
         Convert a chord pattern to a Fingering object.
@@ -873,25 +1007,62 @@ class ChordPatternDatabase:
         Returns:
             Fingering object created from the pattern
         """
-        fretboard = Fretboard(STANDARD_TUNING)
-        positions = []
-        
-        # Convert fret pattern to positions
-        for string_index, fret in enumerate(pattern.frets):
-            if fret is not None:  # Not muted
-                string = 6 - string_index  # Convert index to string number (6,5,4,3,2,1)
-                note = fretboard.get_note_at_position(string, fret)
-                position = FretPosition(string=string, fret=fret, note=note)
-                positions.append(position)
+        # Positions depend only on the (immutable) pattern, so build them once
+        positions = pattern._positions
+        if positions is None:
+            positions = self._pattern_positions(pattern)
+            object.__setattr__(pattern, '_positions', positions)
         
         # Create fingering
         fingering = Fingering(
-            positions=positions,
-            finger_assignments=pattern.finger_assignments.copy(),
+            positions=list(positions),
+            finger_assignments=dict(pattern.finger_assignments),
             chord=chord
         )
         
         return fingering
+    
+    def patterns_to_fingerings(self, patterns: Iterable[ChordPattern], chord,
+                               max_keep: Optional[int] = None,
+                               score: Optional[Callable[[Fingering], float]] = None) -> Tuple[Fingering, ...]:
+        """
+        Convert several chord patterns to Fingering objects in one pass.
+        
+        Args:
+            patterns: The chord patterns to convert
+            chord: The chord these fingerings represent
+            max_keep: Keep at most this many fingerings (all if None)
+            score: Optional ranking function (higher is better); when given
+                with max_keep, only the best max_keep fingerings are kept
+                while converting
+            
+        Returns:
+            Tuple of fingerings, in pattern order or best-first when scored
+        """
+        to_fingering = self.pattern_to_fingering
+        
+        if score is None:
+            fingerings = (to_fingering(pattern, chord) for pattern in patterns)
+            return tuple(islice(fingerings, max_keep))
+        
+        if max_keep is None:
+            scored = [(score(fingering), fingering)
+                      for fingering in (to_fingering(pattern, chord) for pattern in patterns)]
+            scored.sort(key=lambda item: item[0], reverse=True)
+            return tuple(fingering for _, fingering in scored)
+        
+        # Streaming top-k: a min-heap of (score, order, fingering) holding the
+        # best max_keep so far; order breaks ties in favour of earlier patterns
+        best: List[Tuple[float, int, Fingering]] = []
+        for order, pattern in enumerate(patterns):
+            fingering = to_fingering(pattern, chord)
+            item = (score(fingering), -order, fingering)
+            if len(best) < max_keep:
+                heapq.heappush(best, item)
+            elif item[:2] > best[0][:2]:
+                heapq.heapreplace(best, item)
+        best.sort(key=lambda item: item[:2], reverse=True)
+        return tuple(fingering for _, _, fingering in best)
 
 
 # Global pattern database instance
@@ -2,37 +2,52 @@
 """
 Command-line JSON interface for guitar chord tools
 This provides a simple way to call the chord generation functions and get JSON output
+
+Usage: python -m src.cli_json <command> [args]
 """
 
 import sys
 import json
 import argparse
 import base64
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Optional, TextIO, Tuple
 
 # Import our core functionality
+from .fingering_generator import generate_chord_fingerings
+from .diagram_generator import generate_chord_diagram
+from .music_theory import Chord
+from .chord_parser import parse_chord
+from .fingering import Fingering
+from .fretboard import FretPosition, Fretboard
+
+
 try:
-    from .fingering_generator import generate_chord_fingerings
-    from .diagram_generator import generate_chord_diagram
-    from .music_theory import Chord
-    from .chord_parser import parse_chord
-    from .fingering import Fingering
-    from .fretboard import FretPosition, Fretboard
+    import orjson
+
+    def _write_json(data: Any, file: Optional[TextIO] = None, indent: bool = False) -> None:
+        """Write data as JSON followed by a newline using orjson"""
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        (file or sys.stdout).write(orjson.dumps(data, option=option).decode())
 except ImportError:
-    # Try relative imports
-    try:
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent))
-        from fingering_generator import generate_chord_fingerings
-        from diagram_generator import generate_chord_diagram
-        from music_theory import Chord
-        from chord_parser import parse_chord
-        from fingering import Fingering
-        from fretboard import FretPosition, Fretboard
-    except ImportError as e:
-        print(f"Error: Could not import required modules: {e}", file=sys.stderr)
-        sys.exit(1)
+    def _write_json(data: Any, file: Optional[TextIO] = None, indent: bool = False) -> None:
+        """Write data as JSON followed by a newline using the standard library"""
+        file = file or sys.stdout
+        json.dump(data, file, indent=2 if indent else None)
+        file.write("\n")
+
+
+@lru_cache(maxsize=128)
+def _cached_fingerings(chord_symbol: str, max_results: int) -> Tuple[Fingering, ...]:
+    """Generate fingerings for a chord symbol, reusing results for repeated requests.
+    
+    A single CLI run rarely repeats a chord, but embedders that call the
+    command functions in-process do. Returns a tuple so cached results
+    can't be modified by callers; use _cached_fingerings.cache_clear()
+    to drop them.
+    """
+    return tuple(generate_chord_fingerings(chord_symbol, max_results=max_results))
 
 
 def format_fingering_for_json(fingering):
@@ -46,7 +61,7 @@ def format_fingering_for_json(fingering):
                 "is_barre_chord": fingering.characteristics.get("is_barre_chord", False),
                 "span": fingering.characteristics.get("span", 0),
                 "hand_position": fingering.characteristics.get("hand_position", "unknown"),
-                "requires_muting": len([pos for pos in fingering.positions if pos.fret == -1]) > 0
+                "requires_muting": any(pos.fret == -1 for pos in fingering.positions)
             },
             "finger_assignments": {
                 str(string): finger.name if hasattr(finger, 'name') else str(finger)
@@ -66,10 +81,7 @@ def format_fingering_for_json(fingering):
 def cmd_generate_fingerings(args):
     """Generate chord fingerings"""
     try:
-        fingerings = generate_chord_fingerings(
-            args.chord_symbol, 
-            max_results=args.max_results
-        )
+        fingerings = _cached_fingerings(args.chord_symbol, args.max_results)
         
         # Filter by difficulty if specified
         if args.difficulty_filter is not None:
@@ -81,10 +93,10 @@ def cmd_generate_fingerings(args):
             "fingerings": [format_fingering_for_json(f) for f in fingerings]
         }
         
-        print(json.dumps(result, indent=2))
+        _write_json(result, indent=True)
         
     except Exception as e:
-        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        _write_json({"error": str(e)}, file=sys.stderr)
         sys.exit(1)
 
 
@@ -95,26 +107,26 @@ def cmd_create_diagram(args):
         
         if args.chord_symbol:
             # Generate fingering from chord symbol
-            fingerings = generate_chord_fingerings(args.chord_symbol, max_results=1)
+            fingerings = _cached_fingerings(args.chord_symbol, 1)
             if not fingerings:
-                print(json.dumps({"error": f"No fingerings found for chord '{args.chord_symbol}'"}), file=sys.stderr)
+                _write_json({"error": f"No fingerings found for chord '{args.chord_symbol}'"}, file=sys.stderr)
                 sys.exit(1)
             fingering = fingerings[0]
             chord_name = args.chord_symbol
             
         else:
-            print(json.dumps({"error": "chord_symbol is required"}), file=sys.stderr)
+            _write_json({"error": "chord_symbol is required"}, file=sys.stderr)
             sys.exit(1)
         
         # Generate diagram
         image_bytes = generate_chord_diagram(fingering, format=args.format)
         
         if not image_bytes:
-            print(json.dumps({"error": "Failed to generate diagram"}), file=sys.stderr)
+            _write_json({"error": "Failed to generate diagram"}, file=sys.stderr)
             sys.exit(1)
         
         # Encode as base64
-        base64_data = base64.b64encode(image_bytes).decode('utf-8')
+        base64_data = base64.b64encode(image_bytes).decode('ascii')
         
         result = {
             "chord_name": chord_name,
@@ -123,10 +135,10 @@ def cmd_create_diagram(args):
             "mime_type": f"image/{args.format}"
         }
         
-        print(json.dumps(result))
+        _write_json(result)
         
     except Exception as e:
-        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        _write_json({"error": str(e)}, file=sys.stderr)
         sys.exit(1)
 
 
@@ -8,9 +8,12 @@ finger positions, and notation.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from typing import Optional, Tuple, List, Dict, Union
 from pathlib import Path
 import io
+import threading
 from dataclasses import dataclass
 
 from .fingering import Fingering, FingerAssignment
@@ -68,6 +71,14 @@ class ChordDiagramGenerator:
             style: Visual styling configuration (uses default if None)
         """
         self.style = style or DiagramStyle()
+        
+        # Persistent single-diagram figure (created on first use). It is built
+        # on an Agg canvas directly, outside pyplot's figure manager, and the
+        # lock serializes renders when the generator is shared between threads.
+        self._fig = None
+        self._canvas = None
+        self._ax = None
+        self._render_lock = threading.Lock()
     
     def generate_diagram(self, fingering: Fingering, 
                         output_path: Optional[Union[str, Path]] = None,
@@ -85,16 +96,57 @@ class ChordDiagramGenerator:
         Returns:
             Image bytes if output_path is None, otherwise None
         """
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(self.style.width, self.style.height))
+        # Save or return image
+        if output_path:
+            self._render(fingering, output_path, format, dpi)
+            return None
+        else:
+            # Return image as bytes
+            buffer = io.BytesIO()
+            self._render(fingering, buffer, format, dpi)
+            return buffer.getvalue()
+    
+    def render_to_file(self, fingering: Fingering,
+                       output_path: Union[str, Path],
+                       dpi: int = 150,
+                       format: Optional[str] = None) -> None:
+        """
+        Render a chord diagram to a file, reusing one figure across calls.
+        
+        Intended for rendering many diagrams in a row: the axes are cleared
+        and redrawn instead of creating (and tearing down) a new figure for
+        every chord.
+        
+        Args:
+            fingering: The fingering to visualize
+            output_path: Path to save the image
+            dpi: Image resolution for raster formats
+            format: Image format (inferred from the file extension if None)
+        """
+        self._render(fingering, output_path, format, dpi)
+    
+    def _render(self, fingering: Fingering, target, format: Optional[str], dpi: int) -> None:
+        """Draw a diagram on the persistent figure and write it to a path or file object"""
+        with self._render_lock:
+            if self._fig is None:
+                self._fig = Figure(figsize=(self.style.width, self.style.height))
+                self._canvas = FigureCanvasAgg(self._fig)
+                self._ax = self._fig.add_subplot(111)
+                self._fig.patch.set_facecolor(self.style.background_color)
+            else:
+                self._ax.clear()
+            
+            self._draw_diagram(self._ax, fingering)
+            self._canvas.print_figure(target, format=format, dpi=dpi,
+                                      bbox_inches='tight', facecolor=self.style.background_color)
+    
+    def _draw_diagram(self, ax, fingering: Fingering):
+        """Set up the axis and draw a complete chord diagram onto it"""
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
         ax.set_aspect('equal')
         ax.axis('off')
         
-        # Set background color
-        fig.patch.set_facecolor(self.style.background_color)
-        
         # Calculate diagram positioning
         diagram_info = self._calculate_diagram_layout(fingering)
         
@@ -105,21 +157,6 @@ class ChordDiagramGenerator:
         self._draw_finger_numbers(ax, fingering, diagram_info)
         self._draw_chord_name(ax, fingering, diagram_info)
         self._draw_position_marker(ax, diagram_info, fingering)
-        
-        # Save or return image
-        if output_path:
-            plt.savefig(output_path, format=format, dpi=dpi, 
-                       bbox_inches='tight', facecolor=self.style.background_color)
-            plt.close(fig)
-            return None
-        else:
-            # Return image as bytes
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format=format, dpi=dpi, 
-                       bbox_inches='tight', facecolor=self.style.background_color)
-            plt.close(fig)
-            buffer.seek(0)
-            return buffer.getvalue()
     
     def _calculate_diagram_layout(self, fingering: Fingering) -> Dict:
         """Calculate the layout parameters for the diagram"""
@@ -468,21 +505,7 @@ class ChordDiagramGenerator:
         # Generate each diagram
         for i, fingering in enumerate(fingerings):
             row, col = divmod(i, cols)
-            ax = axes[row][col]
-            
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.set_aspect('equal')
-            ax.axis('off')
-            
-            # Calculate and draw diagram
-            diagram_info = self._calculate_diagram_layout(fingering)
-            self._draw_grid(ax, diagram_info)
-            self._draw_finger_positions(ax, fingering, diagram_info)
-            self._draw_string_markers(ax, fingering, diagram_info)
-            self._draw_finger_numbers(ax, fingering, diagram_info)
-            self._draw_chord_name(ax, fingering, diagram_info)
-            self._draw_position_marker(ax, diagram_info, fingering)
+            self._draw_diagram(axes[row][col], fingering)
         
         # Hide unused subplots
         for i in range(len(fingerings), rows * cols):
@@ -10,6 +10,7 @@ This module provides classes and functions for:
 from typing import List, Dict, Tuple, Optional, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
+import heapq
 import math
 
 from .music_theory import Note, Chord
@@ -485,8 +486,8 @@ class FingeringValidator:
         # Import here to avoid circular imports
         from .chord_patterns import CHORD_PATTERNS
         
-        # Convert fingering to shape for comparison
-        fingering_shape = fingering.get_chord_shape()
+        # Convert fingering to shape for comparison (patterns store frets as tuples)
+        fingering_shape = tuple(fingering.get_chord_shape())
         
         # Check if this matches a known pattern
         matching_patterns = CHORD_PATTERNS.find_matching_patterns(
@@ -649,12 +650,14 @@ class FingeringValidator:
         else:
             return 0.3   # Heavy penalty for multiple gaps
     
-    def rank_fingerings(self, fingerings: List[Fingering]) -> List[Fingering]:
+    def rank_fingerings(self, fingerings: List[Fingering], limit: Optional[int] = None) -> List[Fingering]:
         """
         Rank a list of fingerings by quality and playability.
         
         Args:
             fingerings: List of fingerings to rank
+            limit: Only return the best `limit` fingerings (selected with a heap
+                instead of a full sort; ties keep their original order)
         
         Returns:
             List of fingerings sorted by quality (best first)
@@ -690,5 +693,8 @@ class FingeringValidator:
             
             return score
         
+        if limit is not None:
+            return heapq.nlargest(limit, fingerings, key=score_fingering)
+        
         # Sort by score (descending)
         return sorted(fingerings, key=score_fingering, reverse=True)
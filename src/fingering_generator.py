@@ -85,6 +85,31 @@ class FingeringGenerator:
         """
         config = config or GenerationConfig()
         
+        # Steps 1-4 gather validated candidates; step 5 ranks and returns top results
+        ranked_fingerings = self.validator.rank_fingerings(self._collect_valid_fingerings(chord, config))
+        
+        return ranked_fingerings[:config.max_results]
+    
+    def generate_top_k(self, chord: Chord, k: int = 1, config: GenerationConfig = None) -> List[Fingering]:
+        """
+        Generate only the best k fingerings for a given chord.
+        
+        Candidates are gathered exactly as in generate_fingerings, but the best
+        k are selected with a heap rather than fully sorting every candidate.
+        
+        Args:
+            chord: The chord to generate fingerings for
+            k: Number of fingerings to return
+            config: Generation configuration parameters (max_results does not cap k)
+            
+        Returns:
+            Up to k fingerings ranked by quality (best first)
+        """
+        config = config or GenerationConfig()
+        return self.validator.rank_fingerings(self._collect_valid_fingerings(chord, config), limit=k)
+    
+    def _collect_valid_fingerings(self, chord: Chord, config: GenerationConfig) -> List[Fingering]:
+        """Generate, finger and validate all candidate fingerings (unranked)"""
         # Step 1: Analyze chord and determine requirements
         requirements = self._analyze_chord_requirements(chord)
         
@@ -136,11 +161,7 @@ class FingeringGenerator:
             if validation['is_playable'] and validation['score'] > 0.3 and fingering.is_playable():
                 valid_fingerings.append(fingering)
         
-        # Step 5: Rank and return top results
-        ranked_fingerings = self.validator.rank_fingerings(valid_fingerings)
-        
-        
-        return ranked_fingerings[:config.max_results]
+        return valid_fingerings
     
     def _analyze_chord_requirements(self, chord: Chord) -> List[ChordToneRequirement]:
         """
@@ -6,7 +6,7 @@ extensions, alterations, and edge cases.
 """
 
 import pytest
-from src.chord_parser import ChordParser, ChordParseError, parse_chord, quick_parse
+from src.chord_parser import ChordParser, ChordParseError, parse_chord, quick_parse, _parse_cache_clear
 from src.music_theory import Note, ChordQuality
 
 
@@ -93,6 +93,14 @@ class TestChordParser:
         g7alt = self.parser.parse("G7alt")
         assert len(g7alt.alterations) > 0  # Should have multiple alterations
     
+    def test_multiple_alterations_and_added_tones(self):
+        """Test that every alteration and added tone in a run is kept"""
+        c7 = self.parser.parse("C7#5b9#11")
+        assert c7.alterations == {5: "#", 9: "b", 11: "#"}
+        
+        c7_adds = self.parser.parse("C7add9(add11)")
+        assert c7_adds.added_tones == [9, 11]
+    
     def test_added_tone_chords(self):
         """Test parsing chords with added tones"""
         cadd9 = self.parser.parse("Cadd9")
@@ -189,6 +197,36 @@ class TestChordParser:
         dm7_mixed = self.parser.parse("dm7")
         assert dm7_mixed.quality == ChordQuality.MINOR_SEVENTH
     
+    def test_tokenizer_matches_regex(self):
+        """Test that the fast tokenizer splits symbols exactly like the regex"""
+        symbols = ["C", "dm7", "F#m7b5/A", "Bbmaj7#11", "Am7add9/C", "Dm(add11)",
+                   "C7alt", "C7#5b9", "CMAJ7", "Cb5", "G13", "Ebø7", "C△7", "Co7/Gb"]
+        for symbol in symbols:
+            groups = self.parser._tokenize(symbol)
+            assert groups is not None, symbol
+            expected = tuple(g or "" for g in self.parser.chord_pattern.match(symbol).groups())
+            assert groups == expected, symbol
+        
+        # Symbols the tokenizer can't handle are left to the regex
+        assert self.parser._tokenize("Cxyz") is None
+        assert self.parser._tokenize("C/") is None
+        with pytest.raises(ChordParseError):
+            self.parser.parse("   ")
+    
+    def test_parse_many(self):
+        """Test parsing a list of symbols with repeats"""
+        chords = self.parser.parse_many(["C", "Am", "F", "G7", "C"])
+        
+        assert [chord.quality for chord in chords] == [
+            ChordQuality.MAJOR, ChordQuality.MINOR, ChordQuality.MAJOR,
+            ChordQuality.DOMINANT_SEVENTH, ChordQuality.MAJOR
+        ]
+        assert chords[0] is chords[4]
+        assert self.parser.parse_many([]) == []
+        
+        with pytest.raises(ChordParseError):
+            self.parser.parse_many(["C", "H7"])
+    
     def test_invalid_chord_symbols(self):
         """Test that invalid chord symbols raise appropriate errors"""
         with pytest.raises(ChordParseError):
@@ -229,12 +267,33 @@ class TestConvenienceFunctions:
         assert chord.root.name == "C"
         assert chord.quality == ChordQuality.MAJOR_SEVENTH
     
+    def test_parsers_share_compiled_patterns(self):
+        """Test that regex patterns are compiled once, not per parser instance"""
+        assert ChordParser().chord_pattern is ChordParser().chord_pattern
+        assert not hasattr(ChordParser(), '__dict__')
+    
+    def test_quality_mappings_are_read_only(self):
+        """Test that the shared quality table cannot be mutated"""
+        with pytest.raises(TypeError):
+            ChordParser.QUALITY_MAPPINGS['x'] = ChordQuality.MAJOR
+    
     def test_quick_parse_function(self):
         """Test the quick_parse function"""
         chord = quick_parse("Dm7")
         assert chord.root.name == "Dm"[0]
         assert chord.quality == ChordQuality.MINOR_SEVENTH
     
+    def test_quick_parse_caches_results(self):
+        """Test that repeated quick_parse calls reuse the parsed chord"""
+        _parse_cache_clear()
+        first = quick_parse("Am7b5/G")
+        assert quick_parse("Am7b5/G") is first
+        
+        # Failures are not cached and keep raising
+        for _ in range(2):
+            with pytest.raises(ChordParseError):
+                quick_parse("Xm7")
+    
     def test_convenience_functions_error_handling(self):
         """Test error handling in convenience functions"""
         with pytest.raises(ChordParseError):
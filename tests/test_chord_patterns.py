@@ -32,6 +32,56 @@ class TestChordPattern:
         assert len(pattern.frets) == 6
         assert pattern.root_string == 5
         assert pattern.root_fret == 3
+    
+    def test_chord_pattern_is_immutable(self):
+        """Test that patterns freeze their frets and finger assignments"""
+        pattern = ChordPattern(
+            name="test_pattern",
+            quality=ChordQuality.MAJOR,
+            frets=[None, 3, 2, 0, 1, 0],
+            root_string=5,
+            root_fret=3,
+            finger_assignments={5: FingerAssignment.RING},
+            pattern_type=PatternType.OPEN
+        )
+        
+        assert pattern.frets == (None, 3, 2, 0, 1, 0)
+        with pytest.raises(TypeError):
+            pattern.finger_assignments[4] = FingerAssignment.MIDDLE
+        with pytest.raises(AttributeError):
+            pattern.root_fret = 5
+        assert not hasattr(pattern, '__dict__')
+        
+        # Frozen patterns can be used as dict keys / cache keys
+        same = ChordPattern(
+            name="test_pattern",
+            quality=ChordQuality.MAJOR,
+            frets=(None, 3, 2, 0, 1, 0),
+            root_string=5,
+            root_fret=3,
+            finger_assignments={5: FingerAssignment.RING},
+            pattern_type=PatternType.OPEN
+        )
+        assert pattern == same
+        assert {pattern: 1}[same] == 1
+    
+    def test_sounding_mask(self):
+        """Test the bitmask of played strings"""
+        pattern = ChordPattern(
+            name="test_pattern",
+            quality=ChordQuality.MAJOR,
+            frets=[None, 3, 2, 0, 1, 0],
+            root_string=5,
+            root_fret=3,
+            finger_assignments={5: FingerAssignment.RING},
+            pattern_type=PatternType.OPEN
+        )
+        
+        assert pattern.sounding_mask == 0b011111  # strings 1-5
+        assert pattern.num_voices == 5
+        assert pattern.sounds_strings(1 << 4)  # string 5
+        assert not pattern.sounds_strings(1 << 5)  # string 6 is muted
+        assert pattern.root_pc == 0  # C on the 5th string, 3rd fret
 
 
 class TestChordPatternDatabase:
@@ -58,6 +108,21 @@ class TestChordPatternDatabase:
         # All patterns should be for major chords
         for pattern in major_patterns:
             assert pattern.quality == ChordQuality.MAJOR
+    
+    def test_databases_share_pattern_objects(self):
+        """Test that the pattern table is built once, not per database"""
+        other = ChordPatternDatabase()
+        mine = self.db.get_patterns_for_quality(ChordQuality.MAJOR)
+        theirs = other.get_patterns_for_quality(ChordQuality.MAJOR)
+        
+        assert all(a is b for a, b in zip(mine, theirs))
+        
+        # ... and so are the patterns transposed from them
+        g_note = Note.from_name("G")
+        assert self.db.find_matching_patterns(g_note, ChordQuality.MAJOR) == \
+            other.find_matching_patterns(g_note, ChordQuality.MAJOR)
+        assert all(a is b for a, b in zip(self.db.find_matching_patterns(g_note, ChordQuality.MAJOR),
+                                          other.find_matching_patterns(g_note, ChordQuality.MAJOR)))
         
         minor_patterns = self.db.get_patterns_for_quality(ChordQuality.MINOR)
         assert len(minor_patterns) > 0
@@ -98,6 +163,49 @@ class TestChordPatternDatabase:
         # Should return empty list (no open F# major pattern)
         assert len(matching) == 0
     
+    def test_find_matching_patterns_transposes_barre_shapes(self):
+        """Test that barre shapes are offered, transposed, for other roots"""
+        g_note = Note.from_name("G")
+        matching = self.db.find_matching_patterns(g_note, ChordQuality.MAJOR)
+        
+        names = [pattern.name for pattern in matching]
+        assert "open_G_major" in names
+        assert "F_major_E_barre_transposed_to_G" in names
+        
+        barre = matching[names.index("F_major_E_barre_transposed_to_G")]
+        assert barre.frets == (3, 5, 5, 4, 3, 3)
+        assert barre.root_fret == 3
+        
+        # The transposed shape keeps (and shares) the original fingers
+        original = next(p for p in self.db.get_patterns_for_quality(ChordQuality.MAJOR)
+                        if p.name == "F_major_E_barre")
+        assert barre.finger_assignments is original.finger_assignments
+        
+        # Transposed patterns are built once and then shared
+        again = self.db.find_matching_patterns(g_note, ChordQuality.MAJOR)
+        assert again[names.index("F_major_E_barre_transposed_to_G")] is barre
+    
+    def test_find_pattern_offsets(self):
+        """Test listing untransposed patterns with the shift each one needs"""
+        g_note = Note.from_name("G")
+        offsets = dict((pattern.name, semitones)
+                       for pattern, semitones in self.db.find_pattern_offsets(g_note, ChordQuality.MAJOR))
+        
+        assert offsets["open_G_major"] == 0
+        assert offsets["F_major_E_barre"] == 2
+    
+    def test_find_many(self):
+        """Test looking up patterns for a whole progression"""
+        c_major = (Note.from_name("C"), ChordQuality.MAJOR)
+        a_minor = (Note.from_name("A"), ChordQuality.MINOR)
+        
+        results = self.db.find_many([c_major, a_minor, c_major])
+        
+        assert len(results) == 3
+        assert results[0] == self.db.find_matching_patterns(*c_major)
+        assert results[1] == self.db.find_matching_patterns(*a_minor)
+        assert results[2] is results[0]
+    
     def test_pattern_to_fingering_c_major(self):
         """Test converting C major pattern to fingering"""
         c_chord = Chord(root=Note.from_name("C"), quality=ChordQuality.MAJOR)
@@ -137,6 +245,38 @@ class TestChordPatternDatabase:
         # Should contain A minor chord tones
         chord_notes = a_minor.get_notes()
         assert fingering.contains_notes(chord_notes)
+    
+    def test_pattern_to_fingering_reuses_positions(self):
+        """Test that repeated conversions share positions but not the list"""
+        c_chord = Chord(root=Note.from_name("C"), quality=ChordQuality.MAJOR)
+        pattern = self.db.find_matching_patterns(c_chord.root, c_chord.quality)[0]
+        
+        first = self.db.pattern_to_fingering(pattern, c_chord)
+        second = self.db.pattern_to_fingering(pattern, c_chord)
+        
+        assert first.positions == second.positions
+        assert first.positions is not second.positions
+        assert all(a is b for a, b in zip(first.positions, second.positions))
+    
+    def test_patterns_to_fingerings(self):
+        """Test batch conversion, with and without top-k scoring"""
+        g_chord = Chord(root=Note.from_name("G"), quality=ChordQuality.MAJOR)
+        patterns = self.db.find_matching_patterns(g_chord.root, g_chord.quality)
+        assert len(patterns) >= 3
+        
+        fingerings = self.db.patterns_to_fingerings(patterns, g_chord)
+        assert [f.positions for f in fingerings] == \
+            [self.db.pattern_to_fingering(p, g_chord).positions for p in patterns]
+        
+        assert len(self.db.patterns_to_fingerings(patterns, g_chord, max_keep=2)) == 2
+        
+        # Keep the two fingerings highest up the neck
+        def highest(f):
+            return max(pos.fret for pos in f.positions)
+        
+        best = self.db.patterns_to_fingerings(patterns, g_chord, max_keep=2, score=highest)
+        expected = sorted((highest(f) for f in fingerings), reverse=True)[:2]
+        assert [highest(f) for f in best] == expected
 
 
 class TestGlobalPatternDatabase:
@@ -172,7 +312,7 @@ class TestOpenChordPatterns:
                 break
         
         assert c_pattern is not None
-        assert c_pattern.frets == [None, 3, 2, 0, 1, 0]  # x-3-2-0-1-0
+        assert c_pattern.frets == (None, 3, 2, 0, 1, 0)  # x-3-2-0-1-0
         assert c_pattern.root_string == 5
         assert c_pattern.root_fret == 3
         assert c_pattern.pattern_type == PatternType.OPEN
@@ -186,7 +326,7 @@ class TestOpenChordPatterns:
         assert len(patterns) > 0
         
         g_pattern = patterns[0]
-        assert g_pattern.frets == [3, 2, 0, 0, 3, 3]  # 3-2-0-0-3-3
+        assert g_pattern.frets == (3, 2, 0, 0, 3, 3)  # 3-2-0-0-3-3
         assert g_pattern.root_string == 6
         assert g_pattern.root_fret == 3
     
@@ -199,7 +339,7 @@ class TestOpenChordPatterns:
         assert len(patterns) > 0
         
         am_pattern = patterns[0]
-        assert am_pattern.frets == [None, 0, 2, 2, 1, 0]  # x-0-2-2-1-0
+        assert am_pattern.frets == (None, 0, 2, 2, 1, 0)  # x-0-2-2-1-0
         assert am_pattern.root_string == 5
         assert am_pattern.root_fret == 0
 
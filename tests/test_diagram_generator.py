@@ -133,6 +133,42 @@ class TestChordDiagramGenerator:
                 if os.path.exists(tmp_file.name):
                     os.unlink(tmp_file.name)
     
+    def test_render_to_file_reuses_figure(self):
+        """Test rendering several diagrams to files with one persistent figure"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for fingerings in (self.c_major_fingerings, self.g_major_fingerings, self.am_fingerings):
+                path = os.path.join(tmp_dir, f"{len(paths)}.png")
+                self.generator.render_to_file(fingerings[0], path)
+                paths.append(path)
+            
+            first_fig = self.generator._fig
+            assert first_fig is not None
+            
+            for path in paths:
+                assert os.path.getsize(path) > 1000
+                with open(path, 'rb') as f:
+                    assert f.read(4) == b'\x89PNG'
+            
+            # Format is inferred from the extension and the figure is reused
+            svg_path = os.path.join(tmp_dir, "c.svg")
+            self.generator.render_to_file(self.c_major_fingerings[0], svg_path)
+            assert self.generator._fig is first_fig
+            assert b'<svg' in Path(svg_path).read_bytes()
+    
+    def test_generate_diagram_reuses_figure(self):
+        """Test that repeated single-diagram renders share one figure"""
+        first = self.generator.generate_diagram(self.c_major_fingerings[0])
+        first_fig = self.generator._fig
+        second = self.generator.generate_diagram(self.g_major_fingerings[0])
+        
+        assert self.generator._fig is first_fig
+        assert first[:4] == second[:4] == b'\x89PNG'
+        assert first != second
+        
+        # Redrawing the first chord gives the same image as before
+        assert self.generator.generate_diagram(self.c_major_fingerings[0]) == first
+    
     def test_generate_multiple_diagrams(self):
         """Test generating multiple diagrams in a grid"""
         fingerings = [
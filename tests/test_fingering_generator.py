@@ -216,6 +216,17 @@ class TestFingeringGenerator:
             chord_notes = dm7.get_notes()
             assert fingering.contains_notes(chord_notes)
     
+    def test_generate_top_k_matches_full_ranking(self):
+        """Test that top-k selection agrees with the fully ranked list"""
+        for symbol in ["C", "Am7", "F"]:
+            chord = quick_parse(symbol)
+            full = self.generator.generate_fingerings(chord, GenerationConfig(max_results=10))
+            
+            for k in (1, 3):
+                top = self.generator.generate_top_k(chord, k)
+                assert len(top) == min(k, len(full))
+                assert [f.get_chord_shape() for f in top] == [f.get_chord_shape() for f in full[:k]]
+    
     def test_generate_fingerings_different_regions(self):
         """Test that generator finds fingerings in different regions"""
         g_major = Chord(root=Note.from_name("G"), quality=ChordQuality.MAJOR)
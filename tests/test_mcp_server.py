@@ -6,14 +6,22 @@ import pytest
 import asyncio
 import json
 import base64
+import logging
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List
 
 # Import test utilities
 from src.fingering import Fingering
 
 # Import MCP server components
+import mcp_server
 from mcp_server import (
     handle_list_tools,
+    handle_call_tool,
     handle_generate_fingerings,
     handle_create_diagram,
     handle_analyze_progression,
@@ -22,7 +30,13 @@ from mcp_server import (
 )
 
 # Import MCP types for testing
-from mcp.types import TextContent, ImageContent
+from mcp.types import TextContent, ImageContent, EmbeddedResource
+
+
+@pytest.fixture(autouse=True)
+def isolated_diagram_cache(tmp_path, monkeypatch):
+    """Keep create_chord_diagram tests out of the real ~/.cache/fretboard"""
+    monkeypatch.setenv("FRETBOARD_CACHE_DIR", str(tmp_path / "diagram-cache"))
 
 
 class TestMCPToolList:
@@ -58,6 +72,46 @@ class TestMCPToolList:
             assert 'required' in schema
 
 
+class TestLogLevel:
+    """Test MCP_LOG_LEVEL handling at import time"""
+    
+    def test_unknown_log_level_falls_back_to_warning(self):
+        """Test that an unknown level name is reported instead of crashing the import"""
+        env = dict(os.environ, MCP_LOG_LEVEL="verbose")
+        result = subprocess.run(
+            [sys.executable, "-c", "import logging, mcp_server; print(logging.getLogger().level)"],
+            cwd=Path(__file__).resolve().parent.parent,
+            env=env, capture_output=True, text=True
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == str(logging.WARNING)
+        assert "Unknown MCP_LOG_LEVEL 'VERBOSE'" in result.stderr
+
+
+class TestToolInputValidation:
+    """Test validation of tool arguments against the tool schemas"""
+    
+    @pytest.mark.asyncio
+    async def test_missing_required_argument(self):
+        """Test that a call without a required argument is rejected"""
+        result = await handle_call_tool("generate_chord_fingerings", {})
+        
+        assert len(result) == 1
+        assert result[0].text.startswith("Input validation error")
+        assert "chord_symbol" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_out_of_range_argument(self):
+        """Test that an argument outside its schema bounds is rejected"""
+        result = await handle_call_tool("create_chord_diagram", {
+            "fingering_specs": [{"positions": [{"string": 7, "fret": 0}]}]
+        })
+        
+        assert len(result) == 1
+        assert result[0].text.startswith("Input validation error")
+
+
 class TestGenerateFingeringsHandler:
     """Test generate_chord_fingerings MCP tool"""
     
@@ -111,6 +165,17 @@ class TestGenerateFingeringsHandler:
         for fingering in response_data['fingerings']:
             assert fingering['difficulty'] <= 0.5
     
+    @pytest.mark.asyncio
+    async def test_generate_fingerings_json_resource(self):
+        """Test that structured results are attached as a JSON resource"""
+        result = await handle_generate_fingerings({"chord_symbol": "Am7", "max_results": 2})
+        
+        assert isinstance(result[-1], EmbeddedResource)
+        assert result[-1].resource.mimeType == "application/json"
+        response_data = json.loads(result[-1].resource.text)
+        assert response_data['chord_symbol'] == 'Am7'
+        assert response_data['total_fingerings'] == len(response_data['fingerings'])
+    
     @pytest.mark.asyncio
     async def test_generate_fingerings_invalid_chord(self):
         """Test handling of invalid chord symbols"""
@@ -352,6 +417,119 @@ class TestBatchDiagramGeneration:
         assert "No valid fingerings to process" in result[0].text
 
 
+class TestDiagramPositionCheck:
+    """Test position bounds checking in create_chord_diagram"""
+    
+    @pytest.mark.asyncio
+    async def test_fret_past_fretboard_rejected_before_rendering(self, monkeypatch):
+        """Test that the schema rejects frets past the fretboard before any rendering"""
+        def fail_render(*render_args):
+            raise AssertionError("render should not run")
+        
+        monkeypatch.setattr(mcp_server, "_render_grid", fail_render)
+        result = await handle_call_tool("create_chord_diagram", {
+            "fingering_specs": [
+                {"positions": [{"string": 5, "fret": 3}, {"string": 4, "fret": 2}]},
+                {"positions": [{"string": 1, "fret": 23}]}
+            ]
+        })
+        
+        assert len(result) == 1
+        assert result[0].text.startswith("Input validation error")
+    
+    @pytest.mark.asyncio
+    async def test_out_of_range_position_reported_per_item(self):
+        """Test that an out-of-range fret passed straight to the handler fails only its own fingering"""
+        args = {
+            "fingering_specs": [
+                {"positions": [{"string": 5, "fret": 3}, {"string": 4, "fret": 2}]},
+                {"positions": [{"string": 1, "fret": 24}]}
+            ]
+        }
+        result = await handle_create_diagram(args)
+        
+        assert len(result) == 2
+        assert "Generated batch diagram with 1 chord(s)" in result[0].text
+        assert "Fingering 2: Fret number must be 0-22, got 24" in result[0].text
+        assert isinstance(result[1], ImageContent)
+
+
+class TestDiagramCache:
+    """Test the on-disk diagram cache used by create_chord_diagram"""
+    
+    @pytest.mark.asyncio
+    async def test_repeated_diagram_served_from_cache(self, tmp_path, monkeypatch):
+        """Test that a repeated request reuses the cached image file"""
+        monkeypatch.setenv("FRETBOARD_CACHE_DIR", str(tmp_path))
+        args = {
+            "fingering_specs": [
+                {
+                    "positions": [
+                        {"string": 5, "fret": 0},
+                        {"string": 4, "fret": 2},
+                        {"string": 3, "fret": 2},
+                        {"string": 2, "fret": 1},
+                        {"string": 1, "fret": 0}
+                    ],
+                    "chord_name": "A Minor"
+                }
+            ]
+        }
+        
+        first = await handle_create_diagram(args)
+        cached_files = list(tmp_path.glob("*.png"))
+        assert len(cached_files) == 1
+        
+        second = await handle_create_diagram(args)
+        assert second[1].data == first[1].data
+        assert list(tmp_path.glob("*.png")) == cached_files
+        
+        # A different chord name renders a different image
+        args["fingering_specs"][0]["chord_name"] = "Am"
+        await handle_create_diagram(args)
+        assert len(list(tmp_path.glob("*.png"))) == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_render(self, monkeypatch):
+        """Test that identical in-flight requests are rendered only once"""
+        monkeypatch.setenv("FRETBOARD_CACHE_DIR", "")
+        render_calls = []
+        render_grid = mcp_server._render_grid
+        
+        def counting_render(*render_args):
+            render_calls.append(render_args)
+            return render_grid(*render_args)
+        
+        monkeypatch.setattr(mcp_server, "_render_grid", counting_render)
+        monkeypatch.setattr(mcp_server, "_render_pool", ThreadPoolExecutor(max_workers=2))
+        args = {
+            "fingering_specs": [
+                {"positions": [{"string": 5, "fret": 3}, {"string": 4, "fret": 2}], "chord_name": "C"}
+            ]
+        }
+        
+        results = await asyncio.gather(*(handle_create_diagram(args) for _ in range(3)))
+        
+        assert len(render_calls) == 1
+        assert all(result[1].data == results[0][1].data for result in results)
+        assert not mcp_server._inflight
+
+
+class TestRenderPool:
+    """Test the lazily started render process pool"""
+    
+    def test_render_pool_started_on_demand_and_shut_down(self, monkeypatch):
+        """Test that the pool is created on first use and cleared by shutdown"""
+        monkeypatch.setattr(mcp_server, "_render_pool", None)
+        
+        pool = mcp_server._get_render_pool()
+        assert mcp_server._get_render_pool() is pool
+        assert pool._mp_context.get_start_method() != "fork"
+        
+        mcp_server._shutdown_render_pool()
+        assert mcp_server._render_pool is None
+
+
 class TestMCPIntegration:
     """Integration tests for MCP server functionality"""
     